@@ -0,0 +1,164 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Union
+import cv2
+import numpy as np
+
+from drone_vision.camera_model import CameraModel
+from drone_vision.frame_state import FrameState
+from drone_vision.inference_cache import InferenceCache
+from drone_vision.inference_interest_area import ANGULAR_PROJECTION
+from drone_vision.mask_buffer_pool import MaskBufferPool
+from drone_vision.pipeline import get_frame_masker, get_polygons_calculator
+from drone_vision.pose import Pose
+from drone_vision.zone_index import ZoneIndex
+
+# Frames waiting between two stages. Bigger queues absorb the jitter of the stages, at the cost of latency.
+DEFAULT_QUEUE_SIZE = 1
+DEFAULT_FOURCC = "mp4v"
+# Put on a queue after the last frame, so the next stage finishes.
+END_OF_VIDEO = None
+
+
+def get_video_statistics(latencies: List[float], seconds: float) -> dict:
+    """
+    Returns the number of frames, the sustained fps and the end-to-end latency in milliseconds (from the start
+    of the decode of a frame to the end of its encode) of a video processed in 'seconds'.
+    """
+
+    frames = len(latencies)
+    statistics = {"frames": frames, "seconds": seconds, "fps": frames/seconds if seconds > 0 else 0.0}
+    if frames > 0:
+        latencies_ms = np.array(latencies)*1000
+        statistics["latency_ms"] = {"mean": float(latencies_ms.mean()),
+                                    "p50": float(np.percentile(latencies_ms, 50)),
+                                    "p95": float(np.percentile(latencies_ms, 95)),
+                                    "max": float(latencies_ms.max())}
+    return statistics
+
+
+class AsyncVideoPipeline(object):
+    """
+    Masks a video with asyncio, running the decode, the calculation of the polygons, the masking and the encode
+    as concurrent stages with bounded queues between them, so the decode of the next frames and the encode of
+    the previous ones overlap with the geometry of the current frame.
+
+    Every stage runs its blocking calls on its own single thread executor: the OpenCV calls release the GIL, so
+    they really run at the same time as the geometry, and every stage keeps the order of the frames. A full
+    queue stops the stage before it, so at most 'queue_size' frames wait between two stages.
+
+    Take note that the overlap trades latency for throughput: up to 4 + 3*'queue_size' frames are in the pipeline
+    at once (one on every stage and the ones on the queues), so when the slowest stage can't keep up, a frame
+    waits behind all of them. With a single core, where the stages can't run at the same time, the fps is about
+    the one of the sequential loop while the latency is several times worse (about 7 frame times with the
+    default queues of 1), so bigger queues only pay off with spare cores and jittery stages.
+    """
+
+    def __init__(self, zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache: Optional[InferenceCache] = None, queue_size: int = DEFAULT_QUEUE_SIZE, fourcc: str = DEFAULT_FOURCC):
+        """
+        Builds the pipeline of the polygons that intersect 'zones', as get_inference_polygons. The masked video is
+        written with the codec 'fourcc'.
+        """
+
+        self.calculate_polygons = get_polygons_calculator(zones, horizontal_FOV, vertical_FOV, camera_model, projection, cache)
+        self.mask_frame = get_frame_masker(MaskBufferPool())
+        self.queue_size = queue_size
+        self.fourcc = fourcc
+
+    async def run(self, video_path: str, poses: Iterable[Pose], output_path: Optional[str] = None) -> dict:
+        """
+        Masks every frame of the video on 'video_path', with the pose of the drone on every frame given by 'poses',
+        writing the masked video on 'output_path' if given. Returns the statistics of get_video_statistics.
+        """
+
+        capture = cv2.VideoCapture(video_path)
+        if not capture.isOpened():
+            raise IOError(f"Can't open the video {video_path}")
+
+        loop = asyncio.get_running_loop()
+        executors = [ThreadPoolExecutor(1) for _ in range(0, 4)]
+        decoded: asyncio.Queue = asyncio.Queue(self.queue_size)
+        with_polygons: asyncio.Queue = asyncio.Queue(self.queue_size)
+        masked: asyncio.Queue = asyncio.Queue(self.queue_size)
+        latencies: List[float] = []
+
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(self.decode(loop, executors[0], capture, poses, decoded)),
+                 asyncio.ensure_future(self.run_stage(loop, executors[1], self.calculate_polygons, decoded, with_polygons)),
+                 asyncio.ensure_future(self.run_stage(loop, executors[2], self.mask_frame, with_polygons, masked)),
+                 asyncio.ensure_future(self.encode(loop, executors[3], masked, output_path, capture.get(cv2.CAP_PROP_FPS), latencies))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+            capture.release()
+
+        return get_video_statistics(latencies, time.perf_counter() - start)
+
+    async def decode(self, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor, capture: cv2.VideoCapture, poses: Iterable[Pose], output: asyncio.Queue):
+        """
+        Reads the frames of 'capture', until the video or the poses end.
+        """
+
+        for index, pose in enumerate(poses):
+            begin = time.perf_counter()
+            is_read, frame = await loop.run_in_executor(executor, capture.read)
+            if not is_read:
+                break
+
+            frame_state = FrameState(index, frame, pose)
+            frame_state.metadata["decode_time"] = begin
+            await output.put(frame_state)
+
+        await output.put(END_OF_VIDEO)
+
+    async def run_stage(self, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor, function: Callable[[FrameState], None], input: asyncio.Queue, output: asyncio.Queue):
+        """
+        Calls 'function' on every frame of 'input', putting it on 'output' afterwards.
+        """
+
+        while True:
+            frame_state = await input.get()
+            if frame_state is END_OF_VIDEO:
+                await output.put(END_OF_VIDEO)
+                return
+
+            await loop.run_in_executor(executor, function, frame_state)
+            await output.put(frame_state)
+
+    async def encode(self, loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor, input: asyncio.Queue, output_path: Optional[str], fps: float, latencies: List[float]):
+        """
+        Writes every frame of 'input' on 'output_path' (if given), recording the latency of every frame.
+        """
+
+        writer: Optional[cv2.VideoWriter] = None
+        try:
+            while True:
+                frame_state = await input.get()
+                if frame_state is END_OF_VIDEO:
+                    return
+
+                if output_path is not None:
+                    if writer is None:
+                        height, width = frame_state.frame.shape[0], frame_state.frame.shape[1]
+                        writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*self.fourcc), fps, (width, height))
+                    await loop.run_in_executor(executor, writer.write, frame_state.frame)
+                latencies.append(time.perf_counter() - frame_state.metadata["decode_time"])
+        finally:
+            if writer is not None:
+                writer.release()
+
+
+def mask_video(video_path: str, poses: Iterable[Pose], output_path: Optional[str], zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, **parameters) -> dict:
+    """
+    Masks the video on 'video_path' with an AsyncVideoPipeline, from synchronous code.
+    """
+
+    pipeline = AsyncVideoPipeline(zones, horizontal_FOV, vertical_FOV, **parameters)
+    return asyncio.run(pipeline.run(video_path, poses, output_path))
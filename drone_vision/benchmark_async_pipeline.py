@@ -0,0 +1,126 @@
+"""
+End-to-end latency and sustained fps of masking a video with AsyncVideoPipeline, against the sequential loop
+of decode, polygons, mask and encode, with several queue sizes. Both masked videos are compared. Without a video,
+a 720p one of random noise is written first.
+
+Run from the repository root with: python -m drone_vision.benchmark_async_pipeline [video] [frames]
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Iterator, List
+import cv2
+import numpy as np
+
+from drone_vision.async_pipeline import DEFAULT_FOURCC, get_video_statistics, mask_video
+from drone_vision.benchmark_parallel_executor import DRONE_POSITION, HEIGHT, HORIZONTAL_FOV, VERTICAL_FOV, WIDTH, get_benchmark_zones
+from drone_vision.frame_state import FrameState
+from drone_vision.mask_buffer_pool import MaskBufferPool
+from drone_vision.pipeline import get_frame_masker, get_polygons_calculator
+from drone_vision.pose import Pose
+
+DEFAULT_FRAMES = 300
+FPS = 30
+QUEUE_SIZES = [1, 2, 4, 8]
+
+
+def write_benchmark_video(path: str, frames: int):
+    rng = np.random.default_rng(0)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*DEFAULT_FOURCC), FPS, (WIDTH, HEIGHT))
+    for _ in range(0, frames):
+        writer.write(rng.integers(0, 256, size=(HEIGHT, WIDTH, 3), dtype=np.uint8))
+    writer.release()
+
+
+def get_poses() -> Iterator[Pose]:
+    """
+    Yields the poses of the drone turning around, so every frame has a different pose.
+    """
+
+    index = 0
+    while True:
+        yield Pose(DRONE_POSITION, -45, 40, (index*7) % 360)
+        index += 1
+
+
+def mask_video_sequentially(video_path: str, output_path: str, zones: List[List[List[float]]]) -> dict:
+    """
+    Reference loop that decodes, calculates the polygons, masks and encodes every frame one after another.
+    """
+
+    calculate_polygons = get_polygons_calculator(zones, HORIZONTAL_FOV, VERTICAL_FOV)
+    mask_frame = get_frame_masker(MaskBufferPool())
+    capture = cv2.VideoCapture(video_path)
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    writer = None
+    latencies = []
+
+    start = time.perf_counter()
+    for index, pose in enumerate(get_poses()):
+        begin = time.perf_counter()
+        is_read, frame = capture.read()
+        if not is_read:
+            break
+        frame_state = FrameState(index, frame, pose)
+        calculate_polygons(frame_state)
+        mask_frame(frame_state)
+        if writer is None:
+            # As AsyncVideoPipeline.encode, the video is written with the size of its frames.
+            height, width = frame_state.frame.shape[0], frame_state.frame.shape[1]
+            writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*DEFAULT_FOURCC), fps, (width, height))
+        writer.write(frame_state.frame)
+        latencies.append(time.perf_counter() - begin)
+    seconds = time.perf_counter() - start
+
+    capture.release()
+    if writer is not None:
+        writer.release()
+    return get_video_statistics(latencies, seconds)
+
+
+def are_same_videos(path_a: str, path_b: str) -> bool:
+    """
+    Determines whether the videos on 'path_a' and 'path_b' have the same frames, once decoded.
+    """
+
+    capture_a = cv2.VideoCapture(path_a)
+    capture_b = cv2.VideoCapture(path_b)
+    try:
+        while True:
+            is_read_a, frame_a = capture_a.read()
+            is_read_b, frame_b = capture_b.read()
+            if is_read_a != is_read_b:
+                return False
+            if not is_read_a:
+                return True
+            if not np.array_equal(frame_a, frame_b):
+                return False
+    finally:
+        capture_a.release()
+        capture_b.release()
+
+
+def print_statistics(name: str, statistics: dict):
+    latency = statistics["latency_ms"]
+    print(f"{name}: {statistics['frames']} frames, {statistics['fps']:.1f} fps, latency mean {latency['mean']:.1f} ms, "
+          f"p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, max {latency['max']:.1f} ms")
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_FRAMES
+    zones = get_benchmark_zones()
+    with tempfile.TemporaryDirectory() as directory:
+        if len(sys.argv) > 1 and sys.argv[1]:
+            video_path = sys.argv[1]
+        else:
+            video_path = os.path.join(directory, "benchmark.mp4")
+            write_benchmark_video(video_path, frames)
+        sequential_path = os.path.join(directory, "masked_sequentially.mp4")
+        asyncio_path = os.path.join(directory, "masked_asyncio.mp4")
+
+        print_statistics("sequential", mask_video_sequentially(video_path, sequential_path, zones))
+        for queue_size in QUEUE_SIZES:
+            statistics = mask_video(video_path, get_poses(), asyncio_path, zones, HORIZONTAL_FOV, VERTICAL_FOV, queue_size=queue_size)
+            print_statistics(f"asyncio, queues of {queue_size}", statistics)
+            print(f"    same masked video: {are_same_videos(sequential_path, asyncio_path)}")
@@ -0,0 +1,50 @@
+"""
+Throughput of the InferencePipeline with a StubDetector of several latencies, with the detector stage run
+serially after the mask and double buffered.
+
+Run from the repository root with: python -m drone_vision.benchmark_detector_stage [frames]
+"""
+import sys
+import time
+
+import numpy as np
+
+from drone_vision.benchmark_parallel_executor import HORIZONTAL_FOV, VERTICAL_FOV, get_benchmark_zones, get_frames_and_poses
+from drone_vision.pipeline import InferencePipeline, get_detector_stage, get_mask_stage, get_polygons_stage
+from drone_vision.stub_detector import StubDetector
+
+DEFAULT_FRAMES = 100
+LATENCIES = [0.005, 0.01, 0.025, 0.05]  # Seconds.
+
+
+def get_pipeline(zones, latency: float, double_buffered: bool) -> InferencePipeline:
+    return InferencePipeline([get_polygons_stage(zones, HORIZONTAL_FOV, VERTICAL_FOV),
+                              get_mask_stage(),
+                              get_detector_stage(StubDetector(latency), HORIZONTAL_FOV, VERTICAL_FOV, double_buffered=double_buffered)])
+
+
+def frames_per_second(pipeline: InferencePipeline, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in pipeline.run(get_frames_and_poses(frames)):
+        pass
+    return frames/(time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES
+    zones = get_benchmark_zones()
+
+    geometry_fps = frames_per_second(InferencePipeline.from_zones(zones, HORIZONTAL_FOV, VERTICAL_FOV), frames)
+    print(f"{frames} frames, polygons and mask only: {geometry_fps:.1f} fps")
+
+    # Both ways give the same detections, the StubDetector ones are the same for every run.
+    serial = list(get_pipeline(zones, 0, False).run_states(get_frames_and_poses(10)))
+    double_buffered = list(get_pipeline(zones, 0, True).run_states(get_frames_and_poses(10)))
+    print("same detections on earth:", all(np.array_equal(a.detections_on_earth, b.detections_on_earth, equal_nan=True)
+                                            for a, b in zip(serial, double_buffered)))
+
+    for latency in LATENCIES:
+        serial_fps = frames_per_second(get_pipeline(zones, latency, False), frames)
+        double_buffered_fps = frames_per_second(get_pipeline(zones, latency, True), frames)
+        print(f"detector latency {latency*1000:.0f} ms: serial {serial_fps:.1f} fps, "
+              f"double buffered {double_buffered_fps:.1f} fps, speedup {double_buffered_fps/serial_fps:.2f}x")
@@ -0,0 +1,82 @@
+"""
+Per-frame latency of getInferenceInterestArea at 720p, 1080p and 4K.
+
+Run from the repository root with: python -m drone_vision.benchmark_inference_interest_area
+"""
+import time
+from typing import List, Tuple
+import numpy as np
+
+from drone_vision.inference_interest_area import drawInferenceMask, getInferenceInterestArea
+
+WHITE = 255
+REPETITIONS = 20
+RESOLUTIONS: List[Tuple[str, int, int]] = [
+    ("720p", 720, 1280),
+    ("1080p", 1080, 1920),
+    ("4K", 2160, 3840),
+]
+
+
+def get_benchmark_polygons(height: int, width: int) -> List[List[List[int]]]:
+    """
+    Creates two interest zones (a trapezoid and a triangle) scaled to a frame of size 'height' * 'width'.
+    """
+
+    trapezoid = [[int(0.1*width), int(0.9*height)], [int(0.3*width), int(0.2*height)],
+                 [int(0.6*width), int(0.2*height)], [int(0.5*width), int(0.9*height)]]
+    triangle = [[int(0.7*width), int(0.8*height)], [int(0.9*width), int(0.1*height)],
+                [int(0.95*width), int(0.7*height)]]
+    return [trapezoid, triangle]
+
+
+def loop_inference_interest_area(frame: np.ndarray, polygons: List[List[List[int]]]) -> np.ndarray:
+    """
+    Reference implementation that paints the frame pixel by pixel, used to verify the vectorized path.
+    """
+
+    height, width = frame.shape[0], frame.shape[1]
+    mask = drawInferenceMask(polygons, height, width)
+
+    for i in range(0, height):
+        for j in range(0, width):
+            if mask[i][j] != WHITE:
+                frame[i][j] = WHITE
+
+    return frame
+
+
+def random_frame(height: int, width: int, channels: int) -> np.ndarray:
+    shape = (height, width, channels) if channels > 1 else (height, width)
+    return np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+
+
+def time_per_frame(frame: np.ndarray, polygons: List[List[List[int]]]) -> float:
+    """
+    Returns the mean latency in milliseconds of masking a copy of 'frame'.
+    """
+
+    frames = [frame.copy() for _ in range(0, REPETITIONS)]
+    start = time.perf_counter()
+    for f in frames:
+        getInferenceInterestArea(f, polygons)
+    return (time.perf_counter() - start)*1000/REPETITIONS
+
+
+if __name__ == "__main__":
+    # The reference loop is only run on 720p, at bigger resolutions it takes too long.
+    height, width = RESOLUTIONS[0][1], RESOLUTIONS[0][2]
+    polygons = get_benchmark_polygons(height, width)
+    for channels in (3, 1):
+        frame = random_frame(height, width, channels)
+        start = time.perf_counter()
+        expected = loop_inference_interest_area(frame.copy(), polygons)
+        loop_ms = (time.perf_counter() - start)*1000
+        result = getInferenceInterestArea(frame.copy(), polygons)
+        print(f"720p {channels}-channel pixel loop: {loop_ms:.1f} ms, identical output: {np.array_equal(expected, result)}")
+
+    for name, height, width in RESOLUTIONS:
+        polygons = get_benchmark_polygons(height, width)
+        for channels in (3, 1):
+            frame = random_frame(height, width, channels)
+            print(f"{name} {channels}-channel: {time_per_frame(frame, polygons):.2f} ms per frame")
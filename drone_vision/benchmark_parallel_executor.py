@@ -0,0 +1,79 @@
+"""
+Throughput of ParallelFrameExecutor and SharedFrameExecutor with 1 to N workers, against the single process
+InferencePipeline, on 720p frames of a drone flying over a set of zones.
+
+Run from the repository root with: python -m drone_vision.benchmark_parallel_executor [frames]
+"""
+import os
+import sys
+import time
+from typing import Iterator, List, Tuple
+import numpy as np
+
+from drone_vision.parallel_executor import ParallelFrameExecutor
+from drone_vision.pipeline import InferencePipeline
+from drone_vision.point import point
+from drone_vision.pose import Pose
+from drone_vision.shared_frame_executor import SharedFrameExecutor
+
+EARTH_RADIUS = 6378137
+HEIGHT = 720
+WIDTH = 1280
+HORIZONTAL_FOV = 120
+VERTICAL_FOV = 60
+DEFAULT_FRAMES = 200
+DRONE_POSITION = point(3.5572512, -76.4239383, EARTH_RADIUS)
+# Grades between zones, about 30 meters.
+ZONES_SPACING = 0.0003
+
+
+def get_benchmark_zones(rows: int = 10, columns: int = 10) -> List[List[List[float]]]:
+    """
+    Creates a grid of square zones around the drone position.
+    """
+
+    zones = []
+    for i in range(0, rows):
+        for j in range(0, columns):
+            theta = DRONE_POSITION.theta + (i - rows/2)*ZONES_SPACING
+            phi = DRONE_POSITION.phi + (j - columns/2)*ZONES_SPACING
+            side = ZONES_SPACING/2
+            zones.append([[theta, phi], [theta + side, phi], [theta + side, phi + side], [theta, phi + side]])
+    return zones
+
+
+def get_frames_and_poses(frames: int) -> Iterator[Tuple[np.ndarray, Pose]]:
+    """
+    Yields 'frames' frames of the drone turning around, so every frame has a different pose.
+    """
+
+    frame = np.random.default_rng(0).integers(0, 256, size=(HEIGHT, WIDTH, 3), dtype=np.uint8)
+    for i in range(0, frames):
+        yield frame.copy(), Pose(DRONE_POSITION, -45, 40, (i*7) % 360)
+
+
+def frames_per_second(results: Iterator, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in results:
+        pass
+    return frames/(time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES
+    zones = get_benchmark_zones()
+    print(f"{frames} frames of {WIDTH}x{HEIGHT}, {len(zones)} zones, {os.cpu_count()} cores")
+
+    pipeline = InferencePipeline.from_zones(zones, HORIZONTAL_FOV, VERTICAL_FOV)
+    single_fps = frames_per_second(pipeline.run(get_frames_and_poses(frames)), frames)
+    print(f"single process: {single_fps:.1f} fps")
+
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        for name, executor in (("pickled frames", ParallelFrameExecutor(zones, HORIZONTAL_FOV, VERTICAL_FOV, workers)),
+                               ("shared memory", SharedFrameExecutor(zones, HORIZONTAL_FOV, VERTICAL_FOV, HEIGHT, WIDTH, 3, workers))):
+            with executor:
+                # The first frames pay the start of the workers.
+                for _ in executor.run(get_frames_and_poses(workers)):
+                    pass
+                fps = frames_per_second(executor.run(get_frames_and_poses(frames)), frames)
+            print(f"{workers} workers, {name}: {fps:.1f} fps, speedup {fps/single_fps:.2f}x")
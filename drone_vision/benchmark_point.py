@@ -0,0 +1,120 @@
+"""
+Memory per point and construction throughput of point and FrozenPoint against the former point class, which kept
+(θ, φ, R) as a second copy of (x, y, z) on a per-instance __dict__, for a workload of 1M points.
+
+Run from the repository root with: python -m drone_vision.benchmark_point
+"""
+import gc
+import time
+import tracemalloc
+from math import cos, sin
+from typing import Callable, List, Tuple
+
+from drone_vision.frozen_point import FrozenPoint
+from drone_vision.point import point
+
+POINTS = 1000000
+REPETITIONS = 3
+
+
+class LegacyPoint(object):
+    """
+    The point class before __slots__, kept here only as the baseline of the benchmark.
+    """
+
+    def __init__(self, x: float, y: float, z: float):
+        self.x = x
+        self.y = y
+        self.z = z
+
+        # equally:
+        self.theta = x
+        self.phi = y
+        self.R = z
+
+    def rotate(self, beta: float):
+        x = self.x*cos(beta) - self.y*sin(beta)
+        y = self.x*sin(beta) + self.y*cos(beta)
+        self.x = self.theta = x
+        self.y = self.phi = y
+
+
+def build_points(point_class: Callable) -> List:
+    return [point_class(i*0.5, i*0.25, 0.0) for i in range(0, POINTS)]
+
+
+def measure_memory(point_class: Callable) -> float:
+    """
+    Returns the bytes allocated per point, the list that holds them excluded.
+    """
+
+    tracemalloc.start()
+    points = build_points(point_class)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list only holds one reference per point, and the float coordinates are shared by every class.
+    coordinates = tracemalloc_of_coordinates()
+    del points
+    return (allocated - coordinates)/POINTS - 8
+
+
+def tracemalloc_of_coordinates() -> int:
+    """
+    Returns the bytes allocated by the float coordinates of the points.
+    """
+
+    tracemalloc.start()
+    coordinates = [(i*0.5, i*0.25) for i in range(0, POINTS)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Minus the tuples and the list that hold them.
+    allocated -= POINTS*(56 + 8)
+    del coordinates
+    return allocated
+
+
+def measure_time(function: Callable) -> float:
+    """
+    Returns the best time, in seconds, of 'function' on REPETITIONS runs. As timeit does, the garbage collector
+    is disabled while timing, otherwise its passes over the million live points dominate the time.
+    """
+
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(0, REPETITIONS):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    return best
+
+
+def rotate_mutable(points: List):
+    for p in points:
+        p.rotate(0.5)
+
+
+def rotate_frozen(points: List[FrozenPoint]) -> List[FrozenPoint]:
+    return [p.rotated(0.5) for p in points]
+
+
+if __name__ == "__main__":
+    classes: List[Tuple[str, Callable, Callable]] = [
+        ("LegacyPoint", LegacyPoint, rotate_mutable),
+        ("point", point, rotate_mutable),
+        ("FrozenPoint", FrozenPoint, rotate_frozen),
+    ]
+
+    print(f"{POINTS} points")
+    print(f"{'class':<12} {'bytes/point':>12} {'build (s)':>10} {'Mpoints/s':>10} {'rotate (s)':>11}")
+    for name, point_class, rotate in classes:
+        memory = measure_memory(point_class)
+        build_time = measure_time(lambda: build_points(point_class))
+        points = build_points(point_class)
+        rotate_time = measure_time(lambda: rotate(points))
+        print(f"{name:<12} {memory:>12.1f} {build_time:>10.3f} {POINTS/build_time/1000000:>10.2f} {rotate_time:>11.3f}")
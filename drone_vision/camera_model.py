@@ -0,0 +1,90 @@
+from math import atan, tan, pi
+from typing import Optional, Tuple
+
+ONE_GRADE_IN_RADIANS = pi/180
+ONE_RADIAN_IN_GRADES = 180/pi
+
+
+def get_focal_length(FOV: float, sensor_diagonal: float) -> float:
+    """
+    Calculates the focal length of a camera from its diagonal 'FOV' and the diagonal of its sensor.
+    """
+
+    return (sensor_diagonal/(2*tan(FOV/2))) * ONE_RADIAN_IN_GRADES
+
+
+def get_sensor_FOV(sensor_size: float, focal_length: float) -> float:
+    """
+    Calculates the FOV, in grades, along a side of the sensor of size 'sensor_size'.
+    """
+
+    return 2 * atan(sensor_size/focal_length) * ONE_RADIAN_IN_GRADES
+
+
+class CameraModel(object):
+    """
+    Constants of a camera that don't depend on the drone pose: its focal length, field of view, the tangents of
+    half the field of view and how many pixels of the frame there are per grade. The model is built once from the
+    sensor specifications and the frame size, so on every frame only the pose dependent math is done.
+
+    Every projection that takes the FOV and the frame size accepts a 'camera_model' instead.
+    """
+
+    def __init__(self, horizontal_FOV: float, vertical_FOV: float, frame_width: Optional[int] = None, frame_height: Optional[int] = None, focal_length: Optional[float] = None):
+        """
+        Builds the model of a camera with the given horizontal and vertical FOV (in grades). The pixels per grade
+        are only known if the frame size is given.
+        """
+
+        self.focal_length = focal_length
+        self.horizontal_FOV = horizontal_FOV
+        self.vertical_FOV = vertical_FOV
+        self.horizontal_half_FOV_tangent = tan(
+            ONE_GRADE_IN_RADIANS*horizontal_FOV/2)
+        self.vertical_half_FOV_tangent = tan(
+            ONE_GRADE_IN_RADIANS*vertical_FOV/2)
+
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.one_grade_in_width_pixels: Optional[float] = None
+        self.one_grade_in_height_pixels: Optional[float] = None
+        if frame_width is not None and frame_height is not None:
+            self.one_grade_in_width_pixels = frame_width/horizontal_FOV
+            self.one_grade_in_height_pixels = frame_height/vertical_FOV
+
+    @classmethod
+    def from_sensor(cls, FOV: float, sensor_diagonal: float, sensor_horizontal: float, sensor_vertical: float, frame_width: Optional[int] = None, frame_height: Optional[int] = None) -> 'CameraModel':
+        """
+        Builds the model from the camera sensor specifications, as get_horizontal_and_vertical_FOV does.
+        """
+
+        focal_length = get_focal_length(FOV, sensor_diagonal)
+        return cls(get_sensor_FOV(sensor_horizontal, focal_length), get_sensor_FOV(sensor_vertical, focal_length),
+                   frame_width, frame_height, focal_length)
+
+    def get_frame_size(self, frame_width: int, frame_height: int) -> Tuple[int, int]:
+        """
+        Returns the frame size of the model, or 'frame_width' * 'frame_height' (the size of the actual frame) if
+        the model was built without it.
+        """
+
+        if self.frame_width is None or self.frame_height is None:
+            return frame_width, frame_height
+        return self.frame_width, self.frame_height
+
+    def get_pixels_per_grade(self, frame_width: int, frame_height: int) -> Tuple[float, float]:
+        """
+        Returns how many pixels of the frame there are per grade, horizontally and vertically, calculated with
+        'frame_width' * 'frame_height' if the model was built without a frame size.
+        """
+
+        if self.one_grade_in_width_pixels is None or self.one_grade_in_height_pixels is None:
+            return frame_width/self.horizontal_FOV, frame_height/self.vertical_FOV
+        return self.one_grade_in_width_pixels, self.one_grade_in_height_pixels
+
+    def get_key(self) -> Tuple[float, float, Optional[int], Optional[int]]:
+        """
+        Returns the values the projections depend on, to key the results calculated with the model.
+        """
+
+        return self.horizontal_FOV, self.vertical_FOV, self.frame_width, self.frame_height
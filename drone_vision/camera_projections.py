@@ -1,11 +1,16 @@
-import copy
 from math import tan
 import math
-from typing import Tuple
+from typing import List, Optional, Tuple, Union
+import numpy as np
 from drone_vision.lines_operations import get_point_inside_line_by_y_coordinate
 from drone_vision.points_operations import vector_norm
 
+from drone_vision.camera_model import CameraModel, get_focal_length, get_sensor_FOV
+from drone_vision.frame_homography import FrameHomography
+from drone_vision.geodetic import get_angles
 from drone_vision.point import point
+from drone_vision.point_array import PointArray
+from drone_vision.polygon_operations import points_to_array
 from drone_vision.quadrilateral import quadrilateral
 
 COMPLETE_CIRCUNFERENCE = 2*math.pi
@@ -13,6 +18,8 @@ ONE_GRADE_IN_RADIANS = math.pi/180
 COMPLETE_CIRCUNFERENCE = 2*math.pi
 ONE_RADIAN_IN_GRADES = 180/math.pi
 MAX_DISTANCE = 400  # measured in meters.
+# Depression, in grades, of the top of the frame vision used to unproject the frames that see the horizon.
+HORIZON_MARGIN = 1
 EARTH_RADIUS = 6378137
 
 
@@ -21,17 +28,14 @@ def get_horizontal_and_vertical_FOV(FOV: float, sensor_diagonal: float, sensor_h
     Calculates the horizontal and vertical FOV from camera sensor specifications. Returns the horizontal and the vertical field of view respectively.
     """
 
-    focal_lenght: float = (sensor_diagonal/(2*tan(FOV/2))
-                           ) * ONE_RADIAN_IN_GRADES
-    horizontal_FOV: float = 2 * \
-        math.atan(sensor_horizontal/focal_lenght) * ONE_RADIAN_IN_GRADES
-    vertical_FOV: float = 2 * \
-        math.atan(sensor_vertical/focal_lenght) * ONE_RADIAN_IN_GRADES
+    focal_lenght: float = get_focal_length(FOV, sensor_diagonal)
+    horizontal_FOV: float = get_sensor_FOV(sensor_horizontal, focal_lenght)
+    vertical_FOV: float = get_sensor_FOV(sensor_vertical, focal_lenght)
 
     return horizontal_FOV, vertical_FOV
 
 
-def get_quadrilateral_projection(inclination_theta: float, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, drone_position: point) -> quadrilateral:
+def get_quadrilateral_projection(inclination_theta: float, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, drone_position: point, camera_model: Optional[CameraModel] = None) -> quadrilateral:
     """
     By using the angles inclination_theta, horizontal_FOV and vertical_FOV and the height
     from the drone to the ground, we project the area that the drone sees in the drone's coordinate
@@ -39,8 +43,17 @@ def get_quadrilateral_projection(inclination_theta: float, horizontal_FOV: float
 
     Take note of angles, here they are taken in counter-clockwise, starting from x-axis for rotations
     made in z-axis and starting from x-axis for rotations made in y-axis.
+
+    If 'camera_model' is given, its FOV is used instead of 'horizontal_FOV' and 'vertical_FOV'.
     """
 
+    if camera_model is not None:
+        horizontal_FOV = camera_model.horizontal_FOV
+        vertical_FOV = camera_model.vertical_FOV
+        half_FOV_tangent = camera_model.horizontal_half_FOV_tangent
+    else:
+        half_FOV_tangent = tan(ONE_GRADE_IN_RADIANS*horizontal_FOV/2)
+
     min_y = -drone_to_ground_height / \
         tan(COMPLETE_CIRCUNFERENCE + ONE_GRADE_IN_RADIANS *
             inclination_theta - ONE_GRADE_IN_RADIANS*vertical_FOV/2)
@@ -56,8 +69,8 @@ def get_quadrilateral_projection(inclination_theta: float, horizontal_FOV: float
     # ! Maximum distance can't be greater that MAX_DISTANCE meters from the min-y measurement.
     max_y = max_y if max_y < (min_y + MAX_DISTANCE) else (min_y + MAX_DISTANCE)
 
-    min_x = abs(min_y)*tan(ONE_GRADE_IN_RADIANS*horizontal_FOV/2)
-    max_x = max_y*tan(ONE_GRADE_IN_RADIANS*horizontal_FOV/2)
+    min_x = abs(min_y)*half_FOV_tangent
+    max_x = max_y*half_FOV_tangent
 
     A = point(-max_x, max_y, 0)
     B = point(max_x, max_y, 0)
@@ -68,6 +81,74 @@ def get_quadrilateral_projection(inclination_theta: float, horizontal_FOV: float
     return projected_quadrilateral
 
 
+def get_quadrilateral_projections(inclination_theta: np.ndarray, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: np.ndarray, yaw: np.ndarray, drone_positions: Union[np.ndarray, List[point]], on_earth: bool = True, camera_model: Optional[CameraModel] = None) -> np.ndarray:
+    """
+    Batched version of get_quadrilateral_projection followed by quadrilateral.rotate and quadrilateral.project_on_earth,
+    for N telemetry samples at once. 'inclination_theta', 'drone_to_ground_height' and 'yaw' are arrays of size N (or
+    scalars shared by every sample), and 'drone_positions' are the N (θ, φ) drone positions, as a (N, 2) array or a
+    list of points.
+
+    Returns a (N, 4, 2) array with the camera footprint of every sample, in the order [A, B, D, C] of
+    quadrilateral.to_weilmar_atherton_representation. The footprint is given in (θ, φ) coordinates, or if not
+    'on_earth', in (x, y) coordinates on the plane relative to every drone position.
+
+    If 'camera_model' is given, its FOV is used instead of 'horizontal_FOV' and 'vertical_FOV'.
+    """
+
+    if camera_model is not None:
+        horizontal_FOV = camera_model.horizontal_FOV
+        vertical_FOV = camera_model.vertical_FOV
+        half_FOV_tangent = camera_model.horizontal_half_FOV_tangent
+    else:
+        half_FOV_tangent = tan(ONE_GRADE_IN_RADIANS*horizontal_FOV/2)
+
+    drone_positions = points_to_array(drone_positions)
+    samples = len(drone_positions)
+    inclination_theta = np.broadcast_to(np.asarray(
+        inclination_theta, dtype=np.float64), (samples,))
+    drone_to_ground_height = np.broadcast_to(np.asarray(
+        drone_to_ground_height, dtype=np.float64), (samples,))
+    yaw = np.broadcast_to(np.asarray(yaw, dtype=np.float64), (samples,))
+
+    min_y = -drone_to_ground_height / \
+        np.tan(COMPLETE_CIRCUNFERENCE + ONE_GRADE_IN_RADIANS *
+               inclination_theta - ONE_GRADE_IN_RADIANS*vertical_FOV/2)
+
+    max_theta_y = COMPLETE_CIRCUNFERENCE + ONE_GRADE_IN_RADIANS * \
+        inclination_theta + ONE_GRADE_IN_RADIANS * vertical_FOV/2
+
+    # ! Angle cant be greater or equal than 360°, same guard of get_quadrilateral_projection.
+    max_theta_y = np.where(max_theta_y < COMPLETE_CIRCUNFERENCE, max_theta_y, 359.99)
+    max_y = -drone_to_ground_height / np.tan(max_theta_y)
+
+    # ! Maximum distance can't be greater that MAX_DISTANCE meters from the min-y measurement.
+    max_y = np.minimum(max_y, min_y + MAX_DISTANCE)
+
+    min_x = np.abs(min_y)*half_FOV_tangent
+    max_x = max_y*half_FOV_tangent
+
+    # Vertices A, B, D and C of every footprint.
+    xs = np.stack((-max_x, max_x, min_x, -min_x), axis=1)
+    ys = np.stack((max_y, max_y, min_y, min_y), axis=1)
+
+    # Same rotation of quadrilateral.rotate.
+    beta = (COMPLETE_CIRCUNFERENCE - yaw*ONE_GRADE_IN_RADIANS)[:, np.newaxis]
+    cos_beta = np.cos(beta)
+    sin_beta = np.sin(beta)
+    footprints = np.empty((samples, 4, 2), dtype=np.float64)
+    footprints[:, :, 0] = xs*cos_beta - ys*sin_beta
+    footprints[:, :, 1] = xs*sin_beta + ys*cos_beta
+
+    if on_earth:
+        # Same projection of point.project_point_on_earth, the latitude from y and the longitude from x.
+        delta_theta = get_angles(footprints[:, :, 1])
+        delta_phi = get_angles(footprints[:, :, 0])
+        footprints[:, :, 0] = drone_positions[:, 0:1] + delta_theta
+        footprints[:, :, 1] = drone_positions[:, 1:2] + delta_phi
+
+    return footprints
+
+
 def project_detection_on_earth(yaw: float, drone_position: point, normalized_detection: point, drone_vision: quadrilateral) -> point:
     """
     Projects 'normalized_detection' on the earth on (latitude, longitude) coordinates based on
@@ -75,8 +156,8 @@ def project_detection_on_earth(yaw: float, drone_position: point, normalized_det
     is imperative.
     """
 
-    unrotated_drone_vision: quadrilateral = copy.deepcopy(drone_vision)
-    unrotated_drone_vision.rotate(COMPLETE_CIRCUNFERENCE - yaw)
+    unrotated_drone_vision: quadrilateral = drone_vision.rotated(
+        COMPLETE_CIRCUNFERENCE - yaw)
 
     yf = abs(unrotated_drone_vision.B - unrotated_drone_vision.D)
     Py = drone_vision.D.y + yf*normalized_detection.y
@@ -94,3 +175,46 @@ def project_detection_on_earth(yaw: float, drone_position: point, normalized_det
     P.project_point_on_earth(drone_position)
 
     return P
+
+
+def project_detections_on_earth(normalized_detections: np.ndarray, drone_position: point, inclination_theta: float, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, yaw: float, camera_model: Optional[CameraModel] = None) -> np.ndarray:
+    """
+    Batched version of project_detection_on_earth: projects the N detections of one frame on the earth. The
+    detections are given as a (N, 2) array of coordinates normalized by the frame size, (0, 0) being the top left
+    corner of the frame and (1, 1) the bottom right one, as the detector gives them.
+
+    Returns a (N, 2) array with the (θ, φ) of every detection, NaN for the ones on or above the horizon.
+    """
+
+    if camera_model is not None:
+        horizontal_FOV = camera_model.horizontal_FOV
+        vertical_FOV = camera_model.vertical_FOV
+
+    # Depression of the bottom of the frame, measured from the horizon.
+    bottom_depression = vertical_FOV/2 - inclination_theta
+    vision_vertical_FOV = vertical_FOV
+    if bottom_depression - vertical_FOV < HORIZON_MARGIN:
+        # The frame sees the horizon, where the frame vision doesn't end, so it's built only with the bottom
+        # rows of the frame, up to HORIZON_MARGIN below the horizon. The rows keep their depressions, the ones
+        # above are unprojected along the same sides and the ones on or above the horizon are NaN.
+        vision_vertical_FOV = bottom_depression - HORIZON_MARGIN
+        if vision_vertical_FOV <= 0:
+            return np.full((len(np.asarray(normalized_detections).reshape(-1, 2)), 2), np.nan)
+
+    drone_vision = get_quadrilateral_projection(
+        vision_vertical_FOV/2 - bottom_depression, horizontal_FOV, vision_vertical_FOV, drone_to_ground_height, drone_position)
+    drone_vision.rotate(yaw)
+
+    # On a frame of 1 * 1 pixels, the pixels are the normalized coordinates, so the frame vision covers a frame
+    # of 1 * (vision_vertical_FOV/vertical_FOV) pixels.
+    frame_homography = FrameHomography(
+        drone_vision, drone_to_ground_height, 1, vision_vertical_FOV/vertical_FOV, vision_vertical_FOV)
+    normalized_detections = np.asarray(
+        normalized_detections, dtype=np.float64).reshape(-1, 2)
+    coordinates = np.column_stack(
+        (normalized_detections[:, 0], 1 - normalized_detections[:, 1]))
+
+    ground = frame_homography.unproject_points(coordinates)
+    detections = PointArray(ground[:, 0], ground[:, 1])
+    detections.project_on_earth(drone_position)
+    return np.column_stack((detections.x, detections.y))
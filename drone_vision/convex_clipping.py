@@ -0,0 +1,415 @@
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+from math import sqrt
+
+from drone_vision.point import point
+from drone_vision.polygon_operations import sort_clockwise_polygon, point_in_polygon, polygon_area
+
+EPSILON = 0.00001
+
+
+def get_edge_normals(convex_polygon: List[point]) -> List[Tuple[float, float, float]]:
+    """
+    For every edge of the clockwise 'convex_polygon' returns the line (a, b, c) such that a*x + b*y + c is the
+    signed distance of a point to the edge, being positive outside the polygon and negative inside it.
+    """
+
+    normals: List[Tuple[float, float, float]] = []
+    for i in range(0, len(convex_polygon)):
+        A = convex_polygon[i]
+        B = convex_polygon[(i + 1) % len(convex_polygon)]
+        length = sqrt((B.x - A.x) ** 2 + (B.y - A.y) ** 2)
+
+        # The interior of a clockwise polygon is at the right of its edges.
+        a = (A.y - B.y)/length
+        b = (B.x - A.x)/length
+        c = -(a*A.x + b*A.y)
+        normals.append((a, b, c))
+
+    return normals
+
+
+def clip_segment(P: point, Q: point, normals: List[Tuple[float, float, float]]) -> Optional[Tuple[float, float]]:
+    """
+    Clips the segment PQ against the convex polygon described by 'normals' (Cyrus-Beck). Returns the
+    parameters (t_in, t_out) of the part of PQ that is inside the polygon, or None if there is no such part.
+    """
+
+    t_in = 0.0
+    t_out = 1.0
+
+    for a, b, c in normals:
+        distance_P = a*P.x + b*P.y + c
+        distance_Q = a*Q.x + b*Q.y + c
+
+        if distance_P > EPSILON and distance_Q > EPSILON:
+            return None
+
+        if distance_P > EPSILON:
+            # PQ enters through this edge.
+            t_in = max(t_in, distance_P/(distance_P - distance_Q))
+        elif distance_Q > EPSILON:
+            # PQ exits through this edge.
+            t_out = min(t_out, distance_P/(distance_P - distance_Q))
+
+    if t_in > t_out:
+        return None
+
+    return t_in, t_out
+
+
+def point_at(P: point, Q: point, t: float) -> point:
+    """
+    Returns the point of segment PQ at parameter 't'.
+    """
+
+    if t == 0.0:
+        return P
+    if t == 1.0:
+        return Q
+    return point(P.x + t*(Q.x - P.x), P.y + t*(Q.y - P.y), 0)
+
+
+def is_outside(P: point, normals: List[Tuple[float, float, float]]) -> bool:
+    """
+    Determines whether 'P' is strictly outside the convex polygon described by 'normals'.
+    """
+
+    for a, b, c in normals:
+        if a*P.x + b*P.y + c > EPSILON:
+            return True
+    return False
+
+
+def is_strictly_inside(P: point, normals: List[Tuple[float, float, float]]) -> bool:
+    """
+    Determines whether 'P' is inside the convex polygon described by 'normals' and not on its perimeter.
+    """
+
+    for a, b, c in normals:
+        if a*P.x + b*P.y + c > -EPSILON:
+            return False
+    return True
+
+
+def perimeter_position(P: point, convex_polygon: List[point], normals: List[Tuple[float, float, float]]) -> float:
+    """
+    Returns the position of 'P', a point on the perimeter of the clockwise 'convex_polygon', as k + t where 'k' is the
+    index of the edge that contains it and 't' the parameter on that edge. Positions grow clockwise.
+    """
+
+    size = len(convex_polygon)
+    best_edge = 0
+    best_distance = None
+    for k in range(0, size):
+        a, b, c = normals[k]
+        distance = abs(a*P.x + b*P.y + c)
+        if best_distance is None or distance < best_distance:
+            A = convex_polygon[k]
+            B = convex_polygon[(k + 1) % size]
+            t = ((P.x - A.x)*(B.x - A.x) + (P.y - A.y)*(B.y - A.y)) / \
+                ((B.x - A.x) ** 2 + (B.y - A.y) ** 2)
+            if -EPSILON < t < 1 + EPSILON:
+                best_edge = k
+                best_distance = distance
+
+    A = convex_polygon[best_edge]
+    B = convex_polygon[(best_edge + 1) % size]
+    t = ((P.x - A.x)*(B.x - A.x) + (P.y - A.y)*(B.y - A.y)) / \
+        ((B.x - A.x) ** 2 + (B.y - A.y) ** 2)
+    position = best_edge + min(max(t, 0.0), 1.0)
+
+    return position % size
+
+
+def is_backward_border_chain(chain: List[point], convex_polygon: List[point], normals: List[Tuple[float, float, float]]) -> bool:
+    """
+    Determines whether 'chain' lies completely on the perimeter of 'convex_polygon' in the opposite sense of it, i.e. the
+    clipping polygon only touches the perimeter from outside and the chain doesn't enclose any area.
+    """
+
+    for i in range(0, len(chain) - 1):
+        A = chain[i]
+        B = chain[i + 1]
+        middle = point((A.x + B.x)/2, (A.y + B.y)/2, 0)
+        if is_strictly_inside(middle, normals):
+            return False
+
+    for i in range(0, len(chain) - 1):
+        A = chain[i]
+        B = chain[i + 1]
+        if A.equal(B):
+            continue
+
+        position = perimeter_position(A, convex_polygon, normals)
+        k = int(position) % len(convex_polygon)
+        C = convex_polygon[k]
+        D = convex_polygon[(k + 1) % len(convex_polygon)]
+        return (B.x - A.x)*(D.x - C.x) + (B.y - A.y)*(D.y - C.y) < 0
+
+    return True
+
+
+def get_inside_chains(clipped_polygon: List[point], clipping_polygon: List[point], normals: List[Tuple[float, float, float]]) -> List[List[point]]:
+    """
+    Walks 'clipping_polygon', which first point must be outside 'clipped_polygon', and returns every chain of
+    consecutive points of it that lies inside 'clipped_polygon'. Every chain begins where the clipping polygon
+    enters 'clipped_polygon' and ends where it exits.
+    """
+
+    chains: List[List[point]] = []
+    chain: List[point] = None
+    size = len(clipping_polygon)
+
+    for i in range(0, size):
+        P = clipping_polygon[i]
+        Q = clipping_polygon[(i + 1) % size]
+        interval = clip_segment(P, Q, normals)
+
+        if interval is None:
+            if chain is not None:
+                chains.append(chain)
+                chain = None
+            continue
+
+        t_in, t_out = interval
+        if chain is not None and t_in > EPSILON:
+            chains.append(chain)
+            chain = None
+
+        if chain is None:
+            chain = [point_at(P, Q, t_in)]
+
+        exit_point = point_at(P, Q, t_out if t_out < 1 - EPSILON else 1.0)
+        if not chain[-1].equal(exit_point):
+            chain.append(exit_point)
+
+        if t_out < 1 - EPSILON:
+            chains.append(chain)
+            chain = None
+
+    if chain is not None:
+        chains.append(chain)
+
+    neo_chains: List[List[point]] = []
+    for chain in chains:
+        # Single points and chains on the perimeter touch 'clipped_polygon' without enclosing any area.
+        if len(chain) < 2 or is_backward_border_chain(chain, clipped_polygon, normals):
+            continue
+        neo_chains.append(chain)
+
+    return neo_chains
+
+
+def get_following_chains(entries: List[float], exits: List[float], size: int) -> Tuple[List[int], List[float]]:
+    """
+    For every chain, given by the perimeter positions of its entry and exit, returns the chain which entry is the
+    nearest one following the perimeter clockwise from its exit, and the distance between them along the perimeter.
+    The chains are sorted once by their entry, so every one is linked with a binary search.
+    """
+
+    order = sorted(range(0, len(entries)), key=lambda k: entries[k])
+    sorted_entries = [entries[k] for k in order]
+    following: List[int] = []
+    following_distances: List[float] = []
+
+    for current in range(0, len(exits)):
+        # The entries just before the exit (within EPSILON, or around the end of the perimeter) and the two
+        # after it are the only candidates, the second one after it is needed when the first is the chain itself.
+        i = bisect_left(sorted_entries, exits[current] - EPSILON)
+        candidates = sorted({order[(i + step) % len(order)] for step in (-1, 0, 1)})
+
+        nearest = current
+        nearest_distance = None
+        for k in candidates:
+            distance = (entries[k] - exits[current]) % size
+            if distance > size - EPSILON:
+                distance = 0.0
+            if k == current and distance < EPSILON:
+                distance = size
+            if nearest_distance is None or distance < nearest_distance:
+                nearest = k
+                nearest_distance = distance
+
+        following.append(nearest)
+        following_distances.append(nearest_distance)
+
+    return following, following_distances
+
+
+def join_chains(clipped_polygon: List[point], chains: List[List[point]], normals: List[Tuple[float, float, float]]) -> List[List[point]]:
+    """
+    Joins the 'chains' that lie inside the clockwise convex 'clipped_polygon' in intersection polygons: from the end of
+    every chain, the perimeter of 'clipped_polygon' is followed clockwise up to the beginning of the nearest chain.
+    """
+
+    size = len(clipped_polygon)
+    entries = [perimeter_position(chain[0], clipped_polygon, normals)
+               for chain in chains]
+    exits = [perimeter_position(chain[-1], clipped_polygon, normals)
+             for chain in chains]
+    following, following_distances = get_following_chains(entries, exits, size)
+    used = [False] * len(chains)
+    intersection_polygons: List[List[point]] = []
+
+    for start in range(0, len(chains)):
+        if used[start]:
+            continue
+
+        intersection_polygon: List[point] = []
+        current = start
+        while True:
+            used[current] = True
+            intersection_polygon.extend(chains[current])
+
+            # Vertices of 'clipped_polygon' passed on the way.
+            vertex = int(exits[current]) + 1
+            while vertex - exits[current] < following_distances[current] - EPSILON:
+                if vertex - exits[current] > EPSILON:
+                    intersection_polygon.append(clipped_polygon[vertex % size])
+                vertex += 1
+
+            current = following[current]
+            if current == start or used[current]:
+                break
+
+        intersection_polygons.append(intersection_polygon)
+
+    return intersection_polygons
+
+
+def get_border_edge(A: point, B: point, normals: List[Tuple[float, float, float]]) -> int:
+    """
+    Returns the index of the edge of the clipping polygon described by 'normals' that contains the segment AB, or
+    -1 if it's not on the perimeter.
+    """
+
+    for k, (a, b, c) in enumerate(normals):
+        if abs(a*A.x + b*A.y + c) < EPSILON and abs(a*B.x + b*B.y + c) < EPSILON:
+            return k
+    return -1
+
+
+def are_opposite_overlapping_segments(A: point, B: point, C: point, D: point) -> bool:
+    """
+    Determines whether the collinear segments AB and CD go in opposite senses and share a part of positive length.
+    """
+
+    direction_x = B.x - A.x
+    direction_y = B.y - A.y
+    length = sqrt(direction_x ** 2 + direction_y ** 2)
+    if length < EPSILON or direction_x*(D.x - C.x) + direction_y*(D.y - C.y) >= 0:
+        return False
+
+    # Parameters of C and D along AB, in units of length.
+    t_C = ((C.x - A.x)*direction_x + (C.y - A.y)*direction_y)/length
+    t_D = ((D.x - A.x)*direction_x + (D.y - A.y)*direction_y)/length
+    return min(length, max(t_C, t_D)) - max(0.0, min(t_C, t_D)) > EPSILON
+
+
+def split_degenerated_joins(polygons: List[List[point]], normals: List[Tuple[float, float, float]]) -> List[List[point]]:
+    """
+    Splits every polygon that goes along a part of the perimeter of the clipping polygon and comes back along it in
+    the opposite sense, i.e. two parts of the intersection joined by an edge without area, as the Weiler-Atherton
+    algorithm returns them as separate polygons. Only the edges on the perimeter are compared.
+    """
+
+    pending = list(polygons)
+    neo_polygons: List[List[point]] = []
+    while pending:
+        polygon = pending.pop()
+        size = len(polygon)
+        border_edges: dict = {}
+        for i in range(0, size):
+            k = get_border_edge(polygon[i], polygon[(i + 1) % size], normals)
+            if k != -1:
+                border_edges.setdefault(k, []).append(i)
+
+        split = None
+        for edges in border_edges.values():
+            for m in range(0, len(edges)):
+                for n in range(m + 1, len(edges)):
+                    i, j = edges[m], edges[n]
+                    if are_opposite_overlapping_segments(polygon[i], polygon[(i + 1) % size],
+                                                         polygon[j], polygon[(j + 1) % size]):
+                        split = (i, j)
+                        break
+                if split is not None:
+                    break
+            if split is not None:
+                break
+
+        if split is None:
+            neo_polygons.append(polygon)
+            continue
+
+        # Edges i -> i + 1 and j -> j + 1 are the way there and back of the join.
+        i, j = split
+        pending.append(polygon[i + 1:j + 1])
+        pending.append(polygon[j + 1:] + polygon[:i + 1])
+
+    return neo_polygons
+
+
+def delete_degenerated_polygons(polygons: List[List[point]]) -> List[List[point]]:
+    """
+    Deletes repeated contiguous points of every polygon and the polygons that don't enclose any area.
+    """
+
+    neo_polygons: List[List[point]] = []
+    for polygon in polygons:
+        neo_polygon: List[point] = []
+        for i in range(0, len(polygon)):
+            A = polygon[i]
+            B = polygon[(i + 1) % len(polygon)]
+            if A.equal(B):
+                continue
+            neo_polygon.append(A)
+
+        if len(neo_polygon) < 3 or abs(polygon_area(neo_polygon)) < EPSILON:
+            continue
+        neo_polygons.append(neo_polygon)
+
+    return neo_polygons
+
+
+def get_convex_intersection_polygons(clipped_polygon: List[point], clipping_polygon: List[point], is_prepared: bool = False) -> List[List[point]]:
+    """
+    Returns every (if any) intersection polygon in 'clipped_polygon' and 'clipping_polygon', where 'clipped_polygon'
+    must be a convex polygon, i.e. the camera_vision. This is the same result of the Weiler-Atherton algorithm, but
+    every edge of 'clipping_polygon' is clipped with the edges of 'clipped_polygon' in constant time, so it's linear
+    in the number of points of 'clipping_polygon', plus sorting the chains inside 'clipped_polygon' to join them.
+    Intersections without area (touching points or segments) are not returned.
+
+    'is_prepared' tells that 'clipping_polygon' is already sorted clockwise, i.e. it comes from a PreparedZone.
+    """
+
+    clipped_polygon = sort_clockwise_polygon(clipped_polygon)
+    if not is_prepared:
+        clipping_polygon = sort_clockwise_polygon(clipping_polygon)
+    normals = get_edge_normals(clipped_polygon)
+
+    first_outside = -1
+    for i in range(0, len(clipping_polygon)):
+        if is_outside(clipping_polygon[i], normals):
+            first_outside = i
+            break
+
+    if first_outside == -1:
+        # clipping_polygon is inside clipped_polygon.
+        return [clipping_polygon]
+
+    # Walking from an outside point, every chain inside 'clipped_polygon' is complete.
+    clipping_polygon = clipping_polygon[first_outside:] + \
+        clipping_polygon[:first_outside]
+    chains = get_inside_chains(clipped_polygon, clipping_polygon, normals)
+
+    if len(chains) == 0:
+        # clipping_polygon doesn't cross clipped_polygon, so the latter is either inside or outside of it.
+        center = point(sum(p.x for p in clipped_polygon)/len(clipped_polygon),
+                       sum(p.y for p in clipped_polygon)/len(clipped_polygon), 0)
+        if point_in_polygon(center, clipping_polygon):
+            return [clipped_polygon]
+        return []
+
+    return delete_degenerated_polygons(split_degenerated_joins(join_chains(clipped_polygon, chains, normals), normals))
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+# Columns of the detections: the box normalized by the frame size, (0, 0) being the top left corner of the frame
+# and (1, 1) the bottom right one, and the confidence.
+X_MIN, Y_MIN, X_MAX, Y_MAX, CONFIDENCE = range(0, 5)
+
+
+class Detector(ABC):
+    """
+    Object detector run on the masked frames, like the yolo engine. Every detector returns the detections of a
+    frame as a (N, 5) array of [x_min, y_min, x_max, y_max, confidence], with the box normalized by the frame size.
+    """
+
+    @abstractmethod
+    def detect(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Returns the detections of 'frame'.
+        """
+
+
+def get_ground_points(detections: np.ndarray) -> np.ndarray:
+    """
+    Returns the (N, 2) normalized coordinates of the point of every detection that touches the ground, the bottom
+    center of its box, as project_detections_on_earth takes them.
+    """
+
+    return np.column_stack(((detections[:, X_MIN] + detections[:, X_MAX])/2, detections[:, Y_MAX]))
@@ -0,0 +1,134 @@
+from math import atan2, pi
+from typing import List, Optional
+import numpy as np
+
+from drone_vision.camera_model import CameraModel
+from drone_vision.point import point
+from drone_vision.quadrilateral import quadrilateral
+
+EPSILON = 0.00001
+ONE_RADIAN_IN_GRADES = 180/pi
+
+
+class FrameHomography(object):
+    """
+    Projection of the ground plane, relative to the drone position, on the pixels of the frame. It's built once per
+    frame from the camera pose, so every vertex is projected with a single array operation instead of one
+    project_point_on_camera_frame call per vertex, giving the same pixels.
+
+    On the frame, the column of a point is its position between the left (AC) and right (BD) sides of the frame
+    vision along the row parallel to CD, and its row is linear on its depression angle from the drone. Both are
+    projective functions of the point on the ground: 'matrix' maps the ground (x, y, 1) to the homogeneous
+    (column numerator, column denominator, height, forward distance), so the column is the first quotient and
+    the depression angle is the angle of the last two.
+    """
+
+    def __init__(self, camera_vision: quadrilateral, drone_to_ground_height: float, frame_width: int, frame_height: int, vertical_FOV: float, camera_model: Optional[CameraModel] = None):
+        """
+        Builds the projection of the frame vision 'camera_vision' (rotated, not projected on earth), seen from
+        'drone_to_ground_height' meters on a frame of size 'frame_width' * 'frame_height'. The top of the frame
+        must be below the horizon, otherwise get_quadrilateral_projection doesn't give the frame vision (see
+        project_detections_on_earth).
+        """
+
+        if camera_model is not None:
+            frame_width, frame_height = camera_model.get_frame_size(frame_width, frame_height)
+            vertical_FOV = camera_model.vertical_FOV
+
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.drone_to_ground_height = drone_to_ground_height
+        self.one_grade_in_height_pixels = frame_height/vertical_FOV
+
+        A, B, C, D = [np.array([p.x, p.y]) for p in (camera_vision.A, camera_vision.B,
+                                                     camera_vision.C, camera_vision.D)]
+        # Right and forward directions of the camera on the ground, AB and CD are parallel.
+        right = (B - A)/np.linalg.norm(B - A)
+        forward = np.array([-right[1], right[0]])
+        if forward @ (A + B - C - D) < 0:
+            forward = -forward
+
+        self.right = right
+        self.forward = forward
+
+        # Forward distance from the drone nadir of the far (AB) and near (CD) sides.
+        far = A @ forward
+        near = C @ forward
+        self.near_depression = atan2(drone_to_ground_height, near)
+
+        # Position of the left and right sides along the right direction, both linear on the forward distance d
+        # from the nadir: side(d) = side_near + side_slope*d.
+        left_slope = (A - C) @ right/(far - near)
+        right_slope = (B - D) @ right/(far - near)
+        left_near = C @ right - left_slope*near
+        right_near = D @ right - right_slope*near
+        self.left_slope, self.left_near = left_slope, left_near
+        self.right_slope, self.right_near = right_slope, right_near
+
+        self.matrix = np.array([
+            [*(frame_width*(right - left_slope*forward)), -frame_width*left_near],
+            [*((right_slope - left_slope)*forward), right_near - left_near],
+            [0, 0, drone_to_ground_height],
+            [*forward, 0],
+        ], dtype=np.float64)
+
+    def get_frame_coordinates(self, points: np.ndarray) -> np.ndarray:
+        """
+        Projects the (N, 2) array of ground 'points' on the frame, returning a (N, 2) array of (column, row)
+        coordinates, the rows counted from the bottom of the frame, without rounding.
+        """
+
+        projected = points @ self.matrix[:, :2].T + self.matrix[:, 2]
+        coordinates = np.empty((len(points), 2), dtype=np.float64)
+        coordinates[:, 0] = projected[:, 0]/projected[:, 1]
+        coordinates[:, 1] = (self.near_depression - np.arctan2(projected[:, 2], projected[:, 3])) * \
+            ONE_RADIAN_IN_GRADES*self.one_grade_in_height_pixels
+        return coordinates
+
+    def project_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Projects the (N, 2) array of ground 'points' on the frame, returning a (N, 2) int32 array of pixels rounded
+        as project_point_on_camera_frame does.
+        """
+
+        coordinates = self.get_frame_coordinates(points)
+
+        pixels = np.empty((len(points), 2), dtype=np.int32)
+        pixels[:, 0] = np.floor(coordinates[:, 0] + EPSILON)
+        pixels[:, 1] = self.frame_height - np.floor(coordinates[:, 1] + EPSILON)
+        return pixels
+
+    def unproject_points(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Inverse of get_frame_coordinates: returns the (N, 2) array of points on the ground seen on the (N, 2) array
+        of frame (column, row) 'coordinates', the rows counted from the bottom of the frame. The points seen on or
+        above the horizon are NaN.
+        """
+
+        depressions = self.near_depression - \
+            coordinates[:, 1]/(self.one_grade_in_height_pixels*ONE_RADIAN_IN_GRADES)
+        # Within EPSILON of the horizon the distance is beyond the earth, it's taken as on the horizon.
+        depressions[(depressions <= EPSILON) | (depressions >= pi)] = np.nan
+        forward_distances = self.drone_to_ground_height/np.tan(depressions)
+
+        left = self.left_near + self.left_slope*forward_distances
+        right = self.right_near + self.right_slope*forward_distances
+        right_distances = left + (right - left)*coordinates[:, 0]/self.frame_width
+
+        return right_distances[:, np.newaxis]*self.right + forward_distances[:, np.newaxis]*self.forward
+
+    def project_polygons(self, polygons: List[List[point]]) -> List[np.ndarray]:
+        """
+        Projects every polygon of 'polygons' on the ground, with all their vertices at once. Returns a (K, 2) int32
+        array of pixels per polygon, ready for cv2.fillPoly.
+        """
+
+        if len(polygons) == 0:
+            return []
+
+        vertices = np.array([[p.x, p.y] for polygon in polygons for p in polygon],
+                            dtype=np.float64).reshape(-1, 2)
+        pixels = self.project_points(vertices)
+
+        ends = np.cumsum([len(polygon) for polygon in polygons])
+        return np.split(pixels, ends[:-1])
@@ -0,0 +1,80 @@
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import numpy as np
+
+
+class FrameRingBuffer(object):
+    """
+    Ring of 'slots' frames of the same shape on a single block of shared memory, so processes pass frames to
+    each other by the index of their slot instead of copying (pickling) them. Every slot is a numpy array on
+    the shared memory, so a frame can be decoded into its slot and masked in place by another process.
+
+    The process that creates the ring owns it and unlinks the memory on 'unlink'. Every other process attaches
+    to it by 'name' with FrameRingBuffer.attach, and closes it when done. The ring doesn't lock the slots: the
+    owner decides which slot is free, like the in-flight window of SharedFrameExecutor does.
+    """
+
+    def __init__(self, slots: int, height: int, width: int, channels: int = 3, name: Optional[str] = None):
+        """
+        Creates the shared memory of 'slots' uint8 frames of 'height' * 'width' * 'channels', or attaches to the
+        existing one called 'name'.
+        """
+
+        self.slots = slots
+        self.shape: Tuple[int, ...] = (height, width, channels) if channels > 1 else (height, width)
+        self.frame_size = height*width*channels
+        self.is_owner = name is None
+        if self.is_owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=slots*self.frame_size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        buffer = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.memory.buf)
+        self.frames: List[np.ndarray] = [buffer[i] for i in range(0, slots)]
+
+    @classmethod
+    def attach(cls, name: str, slots: int, height: int, width: int, channels: int = 3) -> 'FrameRingBuffer':
+        """
+        Attaches to the ring called 'name', created by another process with the same shape.
+        """
+
+        return cls(slots, height, width, channels, name)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def __len__(self) -> int:
+        return self.slots
+
+    def __getitem__(self, slot: int) -> np.ndarray:
+        """
+        Returns the frame of 'slot', a view on the shared memory.
+        """
+
+        return self.frames[slot]
+
+    def get_parameters(self) -> Tuple[str, int, int, int, int]:
+        """
+        Returns the parameters to attach to the ring from another process.
+        """
+
+        height, width = self.shape[0], self.shape[1]
+        channels = self.shape[2] if len(self.shape) > 2 else 1
+        return self.name, self.slots, height, width, channels
+
+    def close(self):
+        """
+        Detaches from the shared memory. The frames of the ring can't be used afterwards.
+        """
+
+        self.frames = []
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Closes and frees the shared memory, only done by the owner.
+        """
+
+        self.close()
+        if self.is_owner:
+            self.memory.unlink()
@@ -0,0 +1,26 @@
+from typing import List, Optional
+import numpy as np
+
+from drone_vision.pose import Pose
+
+
+class FrameState(object):
+    """
+    A frame going through the stages of an InferencePipeline, with everything the stages calculated for it.
+    """
+
+    def __init__(self, index: int, frame: np.ndarray, pose: Pose):
+        """
+        Builds the state of the frame number 'index' of the video, taken on 'pose'.
+        """
+
+        self.index = index
+        self.frame = frame
+        self.pose = pose
+        # Polygons on the frame to make inference on, and the index of the zone of every one of them.
+        self.polygons: Optional[List] = None
+        self.zone_indexes: List[int] = []
+        # Detections on the masked frame, as a Detector gives them, and the (θ, φ) of every one of them.
+        self.detections: Optional[np.ndarray] = None
+        self.detections_on_earth: Optional[np.ndarray] = None
+        self.metadata: dict = {"index": index}
@@ -0,0 +1,95 @@
+from math import cos, sin
+from typing import NamedTuple
+
+from drone_vision.point import EPSILON, point, get_earth_coordinates, get_plane_coordinates
+
+
+def new_frozen_point(x: float, y: float, z: float) -> 'FrozenPoint':
+    """
+    Builds a FrozenPoint skipping the argument handling of its constructor, which is most of its cost.
+    """
+
+    return tuple.__new__(FrozenPoint, (x, y, z))
+
+
+class FrozenPoint(NamedTuple):
+    """
+    Immutable point in 3d coordinate system, being (x, y, z) or (θ, φ, R) like point. It's a tuple, so it
+    can be shared or used as a dictionary key without copying it.
+
+    The transforms return a new point instead of changing this one, so they have the names of the non-mutating
+    transforms of point (rotated, translated, projected_on_earth and projected_to_plane). It's only used by
+    benchmark_point, as the immutable alternative to point.
+    """
+
+    x: float
+    y: float
+    z: float = 0.0
+
+    @classmethod
+    def from_point(cls, P: point) -> 'FrozenPoint':
+        return cls(P.x, P.y, P.z)
+
+    def to_point(self) -> point:
+        return point(self.x, self.y, self.z)
+
+    @property
+    def theta(self) -> float:
+        return self.x
+
+    @property
+    def phi(self) -> float:
+        return self.y
+
+    @property
+    def R(self) -> float:
+        return self.z
+
+    def rotated(self, beta: float) -> 'FrozenPoint':
+        """
+        Returns the point rotated by 'beta' radians in counter-clocwise.
+        """
+
+        x, y, z = self
+        return new_frozen_point(x*cos(beta) - y*sin(beta), x*sin(beta) + y*cos(beta), z)
+
+    def translated(self, translation_point: point) -> 'FrozenPoint':
+        """
+        Returns the point with its origin translated by 'translation_point'. Z its omitted.
+        """
+
+        x, y, z = self
+        return new_frozen_point(x + translation_point.x, y + translation_point.y, z)
+
+    def projected_on_earth(self, drone_position: point) -> 'FrozenPoint':
+        """
+        Returns the latitude and longitude of the point, given on the plane relative to 'drone_position'.
+        """
+
+        theta, phi = get_earth_coordinates(self.x, self.y, drone_position)
+        return new_frozen_point(theta, phi, self.z)
+
+    def projected_to_plane(self, drone_position: point) -> 'FrozenPoint':
+        """
+        Returns the point, given as (θ, φ), on the planar surface relative to 'drone_position'.
+        """
+
+        x, y = get_plane_coordinates(self.x, self.y, drone_position)
+        return new_frozen_point(x, y, self.z)
+
+    def equal(self, B: point) -> bool:
+        """
+        Compares whether points A and B are equal or not.
+        """
+
+        return abs(self.x - B.x) <= EPSILON and abs(self.y - B.y) <= EPSILON
+
+    def dot_product(self, B: point) -> float:
+        """
+        Return dot product between self and B.
+        """
+
+        return self.x*B.x + self.y*B.y
+
+    def to_string(self) -> str:
+        return f"{self.x:.2f} {self.y:.2f}"
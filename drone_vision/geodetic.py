@@ -0,0 +1,56 @@
+"""
+Conversion of whole coordinate arrays between (θ, φ) on earth and (x, y) on the plane relative to the drone position,
+where x comes from the delta in longitude and y from the delta in latitude.
+
+A delta of angle α on earth is the chord 2R·sin(α/2) on the plane, and a chord c is the angle 2·asin(c/2R). These are
+the functions that the former chord formulas R·sqrt(2(1 - cos(α))) and acos(1 - c²/2R²) compute, without their loss
+of precision when α is small, so against them:
+
+- On the plane, the former formula had a rounding error of up to 4.5e-3/c meters (e.g. 0.45 mm on a chord of 10 m)
+  and gave 0 for deltas under 1e-9° (0.1 mm). These formulas are exact to the float precision.
+- On earth, the former formula gave 0 for every chord under 0.64 m (its 1e-7 radians threshold), so the difference
+  is up to 0.64 m next to the drone, and otherwise up to 4.5e-3/c meters of rounding.
+
+On a footprint of a few meters or more both agree below the millimeter, far below a pixel.
+"""
+from math import pi
+from typing import Tuple
+import numpy as np
+
+from drone_vision.point import point
+
+ONE_GRADE_IN_RADIANS = pi/180
+ONE_RADIAN_IN_GRADES = 180/pi
+EARTH_RADIUS = 6378137
+
+
+def get_chords(angles: np.ndarray) -> np.ndarray:
+    """
+    Calculates the signed chords, in meters, of 'angles' given in grades.
+    """
+
+    return 2*EARTH_RADIUS*np.sin(np.asarray(angles, dtype=np.float64)*(ONE_GRADE_IN_RADIANS/2))
+
+
+def get_angles(chords: np.ndarray) -> np.ndarray:
+    """
+    Calculates the signed angles, in grades, of 'chords' given in meters.
+    """
+
+    return 2*np.arcsin(np.asarray(chords, dtype=np.float64)/(2*EARTH_RADIUS))*ONE_RADIAN_IN_GRADES
+
+
+def earth_to_plane(theta: np.ndarray, phi: np.ndarray, drone_position: point) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Projects the points (θ, φ) on the plane relative to 'drone_position', returning their (x, y).
+    """
+
+    return get_chords(phi - drone_position.phi), get_chords(theta - drone_position.theta)
+
+
+def plane_to_earth(x: np.ndarray, y: np.ndarray, drone_position: point) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Projects the points (x, y), on the plane relative to 'drone_position', on earth, returning their (θ, φ).
+    """
+
+    return drone_position.theta + get_angles(y), drone_position.phi + get_angles(x)
@@ -1,7 +1,7 @@
-import copy
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from math import acos, floor, sqrt, pi
 
+from drone_vision.camera_model import CameraModel
 from drone_vision.point import point
 from drone_vision.quadrilateral import quadrilateral
 from drone_vision.lines_operations import point_on_line, get_point_end_and_init_paralallel_to_line_on_two_lines, project_point_on_line
@@ -14,18 +14,22 @@ CLOCKWISE_ORIENTATION = 1
 COUNTERCLOCKWISE_ORIENTATION = 2
 
 
-def project_point_on_camera_frame(horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, frame_width: int, frame_height: int, camera_vision: quadrilateral, objetive_point: point) -> List[float]:
+def project_point_on_camera_frame(horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, frame_width: int, frame_height: int, camera_vision: quadrilateral, objetive_point: point, camera_model: Optional[CameraModel] = None) -> List[float]:
     """
     Project 'objetive_point' in the camera frame by calculating the angles formed in drone_position to ground
     to 'objetive_point' and the leftmost line of projected 'camera_vision' on the ground to 'objetive_point'.
 
+    If 'camera_model' is given, its FOV, frame size and pixels per grade are used instead of the ones given,
+    except for the frame size if the model doesn't have it.
+
     Returns:
     (x, y) coordinates on camera frame.
     """
 
     camera_frame_theta_x: float = 0
     camera_frame_theta_y: float = 0
-    projection_point_y: point = copy.deepcopy(objetive_point)
+    # Only read, or replaced by its projection on the line, so it doesn't need a copy.
+    projection_point_y: point = objetive_point
     DC: point = point((camera_vision.D.x + camera_vision.C.x)/2,
                       (camera_vision.D.y + camera_vision.C.y)/2, 0)
     BA: point = point((camera_vision.B.x + camera_vision.A.x)/2,
@@ -37,8 +41,13 @@ def project_point_on_camera_frame(horizontal_FOV: float, vertical_FOV: float, dr
     # print("Point begin: ", f'({P_begin.x}, {P_begin.y})')
     # print("Point end: ", f'({P_end.x}, {P_end.y})')
 
-    ONE_GRADE_IN_HEIGHT_PIXELS = frame_height/vertical_FOV
-    ONE_GRADE_IN_WIDTH_PIXELS = frame_width/horizontal_FOV
+    if camera_model is not None:
+        horizontal_FOV = camera_model.horizontal_FOV
+        frame_width, frame_height = camera_model.get_frame_size(frame_width, frame_height)
+        ONE_GRADE_IN_WIDTH_PIXELS, ONE_GRADE_IN_HEIGHT_PIXELS = camera_model.get_pixels_per_grade(frame_width, frame_height)
+    else:
+        ONE_GRADE_IN_HEIGHT_PIXELS = frame_height/vertical_FOV
+        ONE_GRADE_IN_WIDTH_PIXELS = frame_width/horizontal_FOV
 
     # objetive point is not the intersection in line formed by DC and BA.
     if not point_on_line(DC, BA, objetive_point):
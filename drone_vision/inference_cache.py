@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from drone_vision.point import point
+
+DEFAULT_MAX_SIZE = 256
+# Quantization steps of the pose, about the noise of the drone sensors.
+POSITION_STEP = 0.000001  # Grades, about 11 centimeters.
+HEIGHT_STEP = 0.05  # Meters.
+ANGLE_STEP = 0.05  # Grades.
+
+
+class InferenceCache(object):
+    """
+    Least recently used cache of the polygons on the frame given by get_inference_polygons (with the index of the
+    zone of every polygon), keyed on the drone pose quantized to the sensor noise and on the version of the set of
+    zones. While the drone hovers, consecutive frames fall on the same cell of the pose, so their polygons are
+    calculated only once.
+
+    Take note that every pose on a cell gets the polygons of the first pose seen on it, and that the polygons
+    returned are shared with the cache, so they shouldn't be modified.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, position_step: float = POSITION_STEP, height_step: float = HEIGHT_STEP, angle_step: float = ANGLE_STEP):
+        """
+        Builds an empty cache that keeps the polygons of up to 'max_size' poses.
+        """
+
+        self.max_size = max_size
+        self.position_step = position_step
+        self.height_step = height_step
+        self.angle_step = angle_step
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_key(self, drone_position: point, drone_to_ground_height: float, inclination_theta: float, yaw: float, zones_version: Hashable, *parameters: Hashable) -> Tuple:
+        """
+        Returns the key of the pose cell, for the version 'zones_version' of the zones. Any other parameter the
+        polygons depend on, like the FOV or the frame size, is added to the key as given.
+        """
+
+        return (round(drone_position.theta/self.position_step), round(drone_position.phi/self.position_step),
+                round(drone_to_ground_height/self.height_step), round(inclination_theta/self.angle_step),
+                round((yaw % 360)/self.angle_step), zones_version) + parameters
+
+    def get(self, key: Tuple) -> Optional[object]:
+        """
+        Returns the value cached on 'key', or None if there is not any.
+        """
+
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Tuple, value: object):
+        """
+        Caches 'value' on 'key', evicting the least recently used value if the cache is full.
+        """
+
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Deletes every cached value, keeping the counters.
+        """
+
+        self.entries.clear()
+
+    def get_hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits/lookups if lookups > 0 else 0.0
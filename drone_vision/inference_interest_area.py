@@ -1,82 +1,169 @@
-import copy
-from typing import List
-import cv2
+from typing import List, Optional, Tuple, Union
 import numpy as np
 
+from drone_vision import instrumentation, tracing
+from drone_vision.camera_model import CameraModel
 from drone_vision.camera_projections import get_quadrilateral_projection
+from drone_vision.frame_homography import FrameHomography
 from drone_vision.geometric_operations import project_point_on_line
+from drone_vision.inference_cache import InferenceCache
+from drone_vision.mask_buffer_pool import MaskBufferPool
 from drone_vision.point import point
 from drone_vision.polygon_operations import format_polygon, project_polygon_on_camera_frame
+from drone_vision.prepared_zone import PreparedZone
+from drone_vision.transform import Transform
 from drone_vision.weiler_atherton_algorithm import calculate_polygon_intersection
+from drone_vision.zone_index import ZoneIndex
 
+# Default pool, used when the caller doesn't manage its own mask buffers.
+MASK_BUFFER_POOL = MaskBufferPool()
+# Margin in degrees (about 1 meter) added to the frame vision bounding box when the zones are queried, this way
+# the rounding of the projection on earth doesn't leave out zones that barely touch the frame vision.
+ZONE_QUERY_MARGIN = 0.00001
+# Projections of the intersections on the frame: by the angles of every vertex (project_polygon_on_camera_frame), or
+# by the ground to frame homography of the frame vision, with every vertex of the frame mapped at once.
+ANGULAR_PROJECTION = "angular"
+HOMOGRAPHY_PROJECTION = "homography"
 
-def drawInferenceMask(polygons: np.ndarray, height: int, width: int):
+
+def drawInferenceMask(polygons: np.ndarray, height: int, width: int, mask_pool: MaskBufferPool = MASK_BUFFER_POOL) -> np.ndarray:
     """
     Draw a mask composed of white and black colours with 255 and 0 values respectively, where the 255
     (white colour) means that the area (i.e. an area of white pixels) is the interest zone to do
     inference on. This function draws the set of polygons specified on 'polygons', creating all the
     interest zones in a mask of size 'height' * 'width'.
-    """
-    mask = np.zeros((height, width))
 
-    for polygon in polygons:
-        polygon = np.array(polygon)
-        cv2.fillPoly(mask, pts=[polygon], color=(255, 255, 255))
+    The mask is a uint8 buffer taken from 'mask_pool', so it's overwritten by the next call with the
+    same resolution.
+    """
 
-    return mask
+    return mask_pool.draw_mask(polygons, height, width)
 
 
-def getInferenceInterestArea(frame: np.ndarray, polygons: List[List[List[float]]]):
+def getInferenceInterestArea(frame: np.ndarray, polygons: List[List[List[float]]], mask_pool: MaskBufferPool = MASK_BUFFER_POOL):
     """
     Transform all the area that is not of interest (area outside the polygons specified on 'polygons')
     in white pixels, where the yolo engine will not recognize anything (hopefully) in the 'frame'. This
     way, we force the yolo engine to make inference on the area where we want it to do it.
     """
-    height, width = len(frame), len(frame[0])
-    mask = drawInferenceMask(polygons, height, width)
-    WHITE = 255
-    AREA_OF_INTEREST = (WHITE, WHITE, WHITE)  # This is color white
 
-    for i in range(0, height):
-        for j in range(0, width):
-            if mask[i][j] != WHITE:
-                # We paint every pixel that its outside the area o interest of white
-                frame[i][j] = AREA_OF_INTEREST
+    return mask_pool.apply_mask(frame, polygons)
+
+
+def applyInferenceMask(frame: np.ndarray, mask: np.ndarray, mask_pool: MaskBufferPool = MASK_BUFFER_POOL) -> np.ndarray:
+    """
+    Paint white, in place, every pixel of 'frame' whose value on 'mask' is not white. The whole frame is
+    masked in a single array operation, so it works the same for 3-channel frames (every channel of the
+    pixel is painted) and single-channel frames.
+    """
+
+    return mask_pool.composite(frame, mask)
+
+
+def get_zones_key(polygons: Union[List[List[List[float]]], ZoneIndex]) -> Tuple:
+    """
+    Returns the key of the set of zones on an InferenceCache: the identifier and version of a ZoneIndex, or the
+    coordinates of every zone of a list.
+    """
+
+    if isinstance(polygons, ZoneIndex):
+        return polygons.identifier, polygons.version
 
-    return frame
+    return tuple(tuple(tuple(p) for p in (polygon.polygon if isinstance(polygon, PreparedZone) else polygon))
+                 for polygon in polygons)
 
 
-def get_inference_polygons(drone_position: point, inclination_theta: float, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, yaw: float, frame: np.ndarray, polygons: List[List[List[float]]]) -> List[List[List[float]]]:
+def get_inference_polygons(drone_position: point, inclination_theta: float, horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, yaw: float, frame: np.ndarray, polygons: Union[List[List[List[float]]], ZoneIndex], camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache: Optional[InferenceCache] = None, intersected_zones: Optional[List[int]] = None) -> Union[List[List[List[float]]], List[np.ndarray]]:
     """
     Calculates the coordinates of polygons (if any) that intersects the frame vision on the ground and the
     restriction zones especified on 'polygons'. Note: the coordinates would be represented on pixels on the
     actual frame, not on the ground.
+
+    'polygons' can be a ZoneIndex, in that case only the zones near the frame vision on the ground are checked.
+    Every zone can be a PreparedZone, so the work that doesn't depend on the drone pose is not repeated.
+    If 'camera_model' is given, its FOV and pixels per grade are used instead of 'horizontal_FOV' and 'vertical_FOV',
+    so it should be built with the size of 'frame', or without a frame size to take the size of 'frame'.
+
+    With the HOMOGRAPHY_PROJECTION 'projection', the polygons are returned as (K, 2) int32 arrays, ready for
+    cv2.fillPoly.
+
+    If 'cache' is given, the polygons of a pose already seen (within the quantization of the cache) are reused.
+    A ZoneIndex is keyed on its identifier and version, while a list of zones is keyed on its coordinates, which
+    are read on every call, so a ZoneIndex is faster to key.
+
+    If 'intersected_zones' is given, the index of the zone of every returned polygon is appended to it.
     """
 
     frame_height = len(frame)
     frame_width = len(frame[0])
 
+    if cache is not None:
+        cache_key = cache.get_key(drone_position, drone_to_ground_height, inclination_theta, yaw, get_zones_key(polygons),
+                                  horizontal_FOV, vertical_FOV, frame_width, frame_height,
+                                  camera_model.get_key() if camera_model is not None else None, projection)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            camera_projected_polygons, polygons_zones = cached
+            if intersected_zones is not None:
+                intersected_zones.extend(polygons_zones)
+            return camera_projected_polygons
+
+    begin = instrumentation.begin_stage()
     projected_camera_vision = get_quadrilateral_projection(
-        inclination_theta, horizontal_FOV, vertical_FOV, drone_to_ground_height, drone_position)
-    projected_camera_vision.rotate(yaw)
-    print(f"A: {projected_camera_vision.A.to_string()}")
-    print(f"B: {projected_camera_vision.B.to_string()}")
-    print(f"C: {projected_camera_vision.C.to_string()}")
-    print(f"D: {projected_camera_vision.D.to_string()}")
-
-    projected_camera_vision_on_earth = copy.deepcopy(projected_camera_vision)
-    projected_camera_vision_on_earth.project_on_earth()
+        inclination_theta, horizontal_FOV, vertical_FOV, drone_to_ground_height, drone_position, camera_model)
+    Transform.yaw_rotation(yaw).apply_to_quadrilateral(projected_camera_vision)
+    instrumentation.end_stage("get_quadrilateral_projection", begin)
+    if tracing.is_enabled(tracing.INFO):
+        tracing.trace(tracing.INFO, f"A: {projected_camera_vision.A.to_string()}")
+        tracing.trace(tracing.INFO, f"B: {projected_camera_vision.B.to_string()}")
+        tracing.trace(tracing.INFO, f"C: {projected_camera_vision.C.to_string()}")
+        tracing.trace(tracing.INFO, f"D: {projected_camera_vision.D.to_string()}")
+
+    begin = instrumentation.begin_stage()
+    projected_camera_vision_on_earth = projected_camera_vision.projected_on_earth()
+    instrumentation.end_stage("project_on_earth", begin)
+
+    # Index of every zone on the whole set of zones, used to trace only some of them.
+    if isinstance(polygons, ZoneIndex):
+        min_theta, min_phi, max_theta, max_phi = projected_camera_vision_on_earth.get_bounding_box()
+        zone_indexes = polygons.query((min_theta - ZONE_QUERY_MARGIN, min_phi - ZONE_QUERY_MARGIN,
+                                       max_theta + ZONE_QUERY_MARGIN, max_phi + ZONE_QUERY_MARGIN))
+        polygons = [polygons.polygons[i] for i in zone_indexes]
+    else:
+        zone_indexes = range(0, len(polygons))
 
     camera_projected_polygons: List[List[List[float]]] = []
-
-    for polygon in polygons:
-        formatted_polygon = format_polygon(polygon, drone_position)
+    # Intersections on the ground, projected all at once at the end with the HOMOGRAPHY_PROJECTION.
+    ground_polygons: List[List[point]] = []
+    # Index of the zone of every polygon.
+    polygons_zones: List[int] = []
+    is_traced = tracing.is_enabled(tracing.INFO)
+    is_instrumented = instrumentation.enabled
+
+    for zone_index, polygon in zip(zone_indexes, polygons):
+        if is_traced:
+            tracing.select_zone(zone_index)
+
+        if isinstance(polygon, PreparedZone):
+            # The clipping translates it from the camera vision drone position.
+            formatted_polygon = polygon
+        else:
+            begin = instrumentation.begin_stage()
+            formatted_polygon = format_polygon(polygon, drone_position)
+            instrumentation.end_stage("format_polygon", begin)
 
         # for p in formatted_polygon:
         #     print(f'{p.x} {p.y}')
 
+        begin = instrumentation.begin_stage()
         has_intersection, polygons_intersections = calculate_polygon_intersection(
             projected_camera_vision, formatted_polygon)
+        instrumentation.end_stage("calculate_polygon_intersection", begin)
+
+        if is_instrumented:
+            intersections = polygons_intersections if has_intersection else []
+            instrumentation.record_zone(zone_index, len(formatted_polygon), len(intersections),
+                                        sum(len(intersection_polygon) for intersection_polygon in intersections))
 
         if has_intersection:
             # print("Polygon intersection")
@@ -84,9 +171,31 @@ def get_inference_polygons(drone_position: point, inclination_theta: float, hori
             #     print(f'({p.x}, {p.y})')
             # print("End polygon intersection")
 
+            polygons_zones.extend([zone_index]*len(polygons_intersections))
+            if projection == HOMOGRAPHY_PROJECTION:
+                ground_polygons.extend(polygons_intersections)
+                continue
+
             for intersection_polygon in polygons_intersections:
+                begin = instrumentation.begin_stage()
                 camera_projected_polygon = project_polygon_on_camera_frame(
-                    horizontal_FOV, vertical_FOV, drone_to_ground_height, frame_width, frame_height, projected_camera_vision, intersection_polygon)
+                    horizontal_FOV, vertical_FOV, drone_to_ground_height, frame_width, frame_height, projected_camera_vision, intersection_polygon, camera_model)
+                instrumentation.end_stage("project_polygon_on_camera_frame", begin)
                 camera_projected_polygons.append(camera_projected_polygon)
 
+    if is_traced:
+        tracing.select_zone(None)
+
+    if projection == HOMOGRAPHY_PROJECTION:
+        begin = instrumentation.begin_stage()
+        frame_homography = FrameHomography(projected_camera_vision, drone_to_ground_height,
+                                           frame_width, frame_height, vertical_FOV, camera_model)
+        camera_projected_polygons = frame_homography.project_polygons(ground_polygons)
+        instrumentation.end_stage("project_polygon_on_camera_frame", begin)
+
+    if cache is not None:
+        cache.put(cache_key, (camera_projected_polygons, polygons_zones))
+    if intersected_zones is not None:
+        intersected_zones.extend(polygons_zones)
+
     return camera_projected_polygons
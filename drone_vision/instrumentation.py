@@ -0,0 +1,185 @@
+"""
+Per-stage timing of the footprint to mask pipeline. It records, for every stage, the number of calls and a latency
+histogram, and for every zone how many vertices and intersections it had. It's stopped by default, and while stopped
+every probe costs a single check.
+
+    instrumentation.start()
+    ... process the flight ...
+    instrumentation.stop()
+    instrumentation.dump("timings.json")
+"""
+import json
+from math import frexp
+from time import perf_counter
+from typing import Dict, Optional
+
+enabled = False
+
+
+class StageStatistics(object):
+    """
+    Number of calls and latency of one stage of the pipeline. The latency histogram counts the calls by powers of two
+    microseconds, i.e. the bucket 8 counts the calls that took more than 4 and up to 8 microseconds.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum: float = None
+        self.maximum: float = None
+        self.histogram: Dict[int, int] = {}
+
+    def record(self, elapsed: float):
+        """
+        Adds one call that took 'elapsed' seconds.
+        """
+
+        self.count += 1
+        self.total += elapsed
+        if self.minimum is None or elapsed < self.minimum:
+            self.minimum = elapsed
+        if self.maximum is None or elapsed > self.maximum:
+            self.maximum = elapsed
+
+        # frexp(m) = (f, e) with m = f * 2^e and 0.5 <= f < 1, so 2^e is the bucket of m.
+        microseconds = elapsed*1000000
+        bucket = 1 if microseconds <= 1 else 2 ** frexp(microseconds)[1]
+        if bucket == 2*microseconds:
+            # 'microseconds' is a power of two, it goes on its own bucket.
+            bucket = int(microseconds)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": self.total,
+            "mean_seconds": self.total/self.count if self.count > 0 else None,
+            "min_seconds": self.minimum,
+            "max_seconds": self.maximum,
+            "histogram_microseconds": {str(bucket): self.histogram[bucket] for bucket in sorted(self.histogram)},
+        }
+
+
+class ZoneStatistics(object):
+    """
+    Number of times a zone was clipped with the camera footprint, its number of vertices and its intersections.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.vertices = 0
+        self.intersections = 0
+        self.intersection_polygons = 0
+        self.intersection_vertices = 0
+
+    def record(self, vertices: int, intersection_polygons: int, intersection_vertices: int):
+        """
+        Adds one clipping of the zone, with 'vertices' vertices, that gave 'intersection_polygons' polygons with
+        'intersection_vertices' vertices in total.
+        """
+
+        self.count += 1
+        self.vertices = vertices
+        if intersection_polygons > 0:
+            self.intersections += 1
+        self.intersection_polygons += intersection_polygons
+        self.intersection_vertices += intersection_vertices
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "vertices": self.vertices,
+            "intersections": self.intersections,
+            "intersection_polygons": self.intersection_polygons,
+            "intersection_vertices": self.intersection_vertices,
+        }
+
+
+stages: Dict[str, StageStatistics] = {}
+zones: Dict[int, ZoneStatistics] = {}
+
+
+def start():
+    """
+    Starts recording, keeping what was recorded before.
+    """
+
+    global enabled
+    enabled = True
+
+
+def stop():
+    """
+    Stops recording, keeping what was recorded.
+    """
+
+    global enabled
+    enabled = False
+
+
+def reset():
+    """
+    Deletes everything recorded.
+    """
+
+    stages.clear()
+    zones.clear()
+
+
+def begin_stage() -> Optional[float]:
+    """
+    Returns the time when a stage begins, or None if nothing is being recorded.
+    """
+
+    if not enabled:
+        return None
+    return perf_counter()
+
+
+def end_stage(name: str, begin: Optional[float]):
+    """
+    Records one call of the stage 'name' that began on 'begin', as returned by begin_stage.
+    """
+
+    if begin is None or not enabled:
+        return
+
+    elapsed = perf_counter() - begin
+    statistics = stages.get(name)
+    if statistics is None:
+        statistics = stages[name] = StageStatistics()
+    statistics.record(elapsed)
+
+
+def record_zone(zone_index: int, vertices: int, intersection_polygons: int, intersection_vertices: int):
+    """
+    Records one clipping of the zone 'zone_index'. See ZoneStatistics.record.
+    """
+
+    if not enabled:
+        return
+
+    statistics = zones.get(zone_index)
+    if statistics is None:
+        statistics = zones[zone_index] = ZoneStatistics()
+    statistics.record(vertices, intersection_polygons, intersection_vertices)
+
+
+def to_dict() -> dict:
+    return {
+        "stages": {name: stages[name].to_dict() for name in stages},
+        "zones": {str(zone_index): zones[zone_index].to_dict() for zone_index in sorted(zones)},
+    }
+
+
+def to_json() -> str:
+    return json.dumps(to_dict(), indent=2)
+
+
+def dump(path: str):
+    """
+    Writes everything recorded, as JSON, on 'path'.
+    """
+
+    with open(path, "w") as file:
+        file.write(to_json())
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import List, Tuple
 from math import pi, acos
 
@@ -251,3 +252,45 @@ def angle_between_segments(A: point, P: point, B: point):
 
     result = dot_product/(norm_AB*norm_PQ)
     return acos(result)
+
+
+def sort_segments_by_x(polygon: List[point]) -> Tuple[List[float], List[Tuple[int, float, float, float]]]:
+    """
+    Sorts the segments of 'polygon' by the minimum x coordinate of their extents. Returns the sorted minimum x
+    coordinates and, in the same order, the tuples (index, max_x, min_y, max_y) of every segment, where 'index' is
+    the index of its first point in 'polygon'.
+    """
+
+    segments = []
+    for i in range(0, len(polygon)):
+        A = polygon[i]
+        B = polygon[(i + 1) % len(polygon)]
+        segments.append((min(A.x, B.x), i, max(A.x, B.x),
+                        min(A.y, B.y), max(A.y, B.y)))
+
+    segments.sort()
+    min_xs = [segment[0] for segment in segments]
+    extents = [segment[1:] for segment in segments]
+    return min_xs, extents
+
+
+def get_candidate_segments(A: point, B: point, min_xs: List[float], extents: List[Tuple[int, float, float, float]]) -> List[int]:
+    """
+    Given the segments sorted by sort_segments_by_x, returns the sorted indexes of the segments whose extents overlap
+    the extent of segment AB. Only those segments can overlap or intersect AB, as every predicate admits points at most
+    EPSILON away from the segments.
+    """
+
+    min_x = min(A.x, B.x) - 2*EPSILON
+    max_x = max(A.x, B.x) + 2*EPSILON
+    min_y = min(A.y, B.y) - 2*EPSILON
+    max_y = max(A.y, B.y) + 2*EPSILON
+
+    candidates = []
+    for k in range(0, bisect_right(min_xs, max_x)):
+        index, segment_max_x, segment_min_y, segment_max_y = extents[k]
+        if segment_max_x >= min_x and segment_min_y <= max_y and segment_max_y >= min_y:
+            candidates.append(index)
+
+    candidates.sort()
+    return candidates
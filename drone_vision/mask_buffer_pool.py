@@ -0,0 +1,91 @@
+from typing import Dict, List, Tuple
+import cv2
+import numpy as np
+
+from drone_vision import instrumentation
+
+WHITE = 255
+BLACK = 0
+# cv2 takes 4-tuples as scalars, every channel of the frame is painted white.
+WHITE_SCALAR = (WHITE, WHITE, WHITE, WHITE)
+
+
+class MaskBufferPool(object):
+    """
+    Keeps a pair of preallocated uint8 buffers for every frame resolution (height, width) seen: the
+    inference mask (255 on the interest zones, 0 elsewhere) and the area outside of the interest zones
+    (1 outside, 0 inside) used to composite the mask on the frame.
+
+    Every call reuses the buffers of its resolution, so masking a video doesn't allocate memory per frame.
+    Take note that a mask returned by the pool is overwritten on the next call with the same resolution,
+    and that a pool shouldn't be shared between threads.
+    """
+
+    def __init__(self):
+        self.buffers: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def get_buffers(self, height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the mask and outside-area buffers of size 'height' * 'width', allocating them only the first time.
+        """
+
+        key = (height, width)
+        buffers = self.buffers.get(key)
+        if buffers is None:
+            buffers = (np.zeros((height, width), dtype=np.uint8),
+                       np.zeros((height, width), dtype=np.uint8))
+            self.buffers[key] = buffers
+
+        return buffers
+
+    def draw_mask(self, polygons: List[List[List[int]]], height: int, width: int) -> np.ndarray:
+        """
+        Clears the pooled mask of size 'height' * 'width' and draws on it, with white, every polygon
+        of 'polygons'.
+        """
+
+        begin = instrumentation.begin_stage()
+        mask, _ = self.get_buffers(height, width)
+        mask.fill(BLACK)
+
+        if len(polygons) > 0:
+            pts = [np.asarray(polygon, dtype=np.int32) for polygon in polygons]
+            cv2.fillPoly(mask, pts=pts, color=WHITE)
+
+        instrumentation.end_stage("drawInferenceMask", begin)
+        return mask
+
+    def composite(self, frame: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Paints white, in place, every pixel of 'frame' whose value on 'mask' is not white.
+        """
+
+        begin = instrumentation.begin_stage()
+        height, width = frame.shape[0], frame.shape[1]
+        _, outside = self.get_buffers(height, width)
+        # Written through a boolean view, so 'outside' holds 0 and 1 values that are valid both
+        # as a numpy boolean mask and as a cv2 operation mask.
+        np.not_equal(mask, WHITE, out=outside.view(np.bool_))
+
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        if frame.dtype == np.uint8 and channels <= len(WHITE_SCALAR) and frame.flags.c_contiguous:
+            # OR-ing with 255 only on masked pixels turns them white, the others are left untouched.
+            # cv2 only writes on 'dst' in place when it's a contiguous array.
+            cv2.bitwise_or(frame, WHITE_SCALAR, dst=frame, mask=outside)
+        else:
+            where = outside.view(np.bool_)
+            if frame.ndim == 3:
+                where = where[:, :, np.newaxis]
+            np.copyto(frame, WHITE, where=where)
+
+        instrumentation.end_stage("applyInferenceMask", begin)
+        return frame
+
+    def apply_mask(self, frame: np.ndarray, polygons: List[List[List[int]]]) -> np.ndarray:
+        """
+        Draws the mask of 'polygons' and composites it on 'frame' in place.
+        """
+
+        height, width = frame.shape[0], frame.shape[1]
+        mask = self.draw_mask(polygons, height, width)
+        return self.composite(frame, mask)
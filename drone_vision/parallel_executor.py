@@ -0,0 +1,102 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Union
+import os
+import numpy as np
+
+from drone_vision.camera_model import CameraModel
+from drone_vision.frame_state import FrameState
+from drone_vision.inference_cache import InferenceCache
+from drone_vision.inference_interest_area import ANGULAR_PROJECTION
+from drone_vision.mask_buffer_pool import MaskBufferPool
+from drone_vision.pipeline import InferencePipeline, get_mask_stage, get_polygons_stage
+from drone_vision.pose import Pose
+from drone_vision.zone_index import ZoneIndex
+
+# Frames submitted to the pool for every worker when the in-flight window is not given.
+FRAMES_IN_FLIGHT_PER_WORKER = 2
+
+# Pipeline of the worker process, built once by the initializer of the pool.
+_worker_pipeline: Optional[InferencePipeline] = None
+
+
+def get_worker_pipeline(zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel], projection: str, cache_size: int, mask: bool) -> InferencePipeline:
+    """
+    Builds the pipeline of a worker process, keeping the zones on it for every frame.
+    """
+
+    cache = InferenceCache(cache_size) if cache_size > 0 else None
+    stages = [get_polygons_stage(zones, horizontal_FOV, vertical_FOV, camera_model, projection, cache)]
+    if mask:
+        # Every worker has its own buffers, a pool shouldn't be shared.
+        stages.append(get_mask_stage(MaskBufferPool()))
+    return InferencePipeline(stages)
+
+
+def _initialize_worker(*pipeline_parameters):
+    global _worker_pipeline
+
+    _worker_pipeline = get_worker_pipeline(*pipeline_parameters)
+
+
+def _process_frame(index: int, frame: np.ndarray, pose: Pose) -> Tuple[np.ndarray, List, dict]:
+    """
+    Runs the pipeline of the worker process on the frame number 'index'.
+    """
+
+    frame_state = _worker_pipeline.process(FrameState(index, frame, pose))
+
+    return frame_state.frame, frame_state.polygons, frame_state.metadata
+
+
+class ParallelFrameExecutor(object):
+    """
+    Runs the default InferencePipeline (the polygons and the mask of every frame) on a pool of processes, as
+    the geometry is pure Python and one process is bound to one core by the GIL.
+
+    The zones are sent to every worker once, when the pool starts, so only the frame and its pose are sent with
+    every task. Results are yielded in the order of the frames, and at most 'max_in_flight' frames are on the
+    pool at once, so a slow consumer stops the reading of frames instead of piling them up in memory.
+
+    Take note that every frame is copied to the worker and the masked frame copied back.
+    """
+
+    def __init__(self, zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, workers: Optional[int] = None, max_in_flight: Optional[int] = None, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache_size: int = 0, mask: bool = True):
+        """
+        Starts a pool of 'workers' processes (one per core by default). With 'cache_size' greater than 0, every
+        worker keeps an InferenceCache of that size. Without 'mask', only the polygons are calculated and the
+        frames are returned unchanged.
+        """
+
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.max_in_flight = max_in_flight if max_in_flight is not None else FRAMES_IN_FLIGHT_PER_WORKER*self.workers
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_initialize_worker,
+                                        initargs=(zones, horizontal_FOV, vertical_FOV, camera_model, projection, cache_size, mask))
+
+    def __enter__(self) -> 'ParallelFrameExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Waits for the frames on the pool and stops the workers.
+        """
+
+        self.pool.shutdown(wait=True)
+
+    def run(self, frames_and_poses: Iterable[Tuple[np.ndarray, Pose]]) -> Iterator[Tuple[np.ndarray, List, dict]]:
+        """
+        Yields (masked frame, polygons, metadata) for every frame of 'frames_and_poses', given as (frame, pose)
+        pairs, in the same order, like InferencePipeline.run.
+        """
+
+        in_flight: Deque[Future] = deque()
+        for index, (frame, pose) in enumerate(frames_and_poses):
+            if len(in_flight) >= self.max_in_flight:
+                yield in_flight.popleft().result()
+            in_flight.append(self.pool.submit(_process_frame, index, frame, pose))
+
+        while in_flight:
+            yield in_flight.popleft().result()
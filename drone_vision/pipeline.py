@@ -0,0 +1,189 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy as np
+
+from drone_vision import instrumentation
+from drone_vision.camera_model import CameraModel
+from drone_vision.camera_projections import project_detections_on_earth
+from drone_vision.detector import Detector, get_ground_points
+from drone_vision.frame_state import FrameState
+from drone_vision.inference_cache import InferenceCache
+from drone_vision.inference_interest_area import ANGULAR_PROJECTION, MASK_BUFFER_POOL, get_inference_polygons, getInferenceInterestArea
+from drone_vision.mask_buffer_pool import MaskBufferPool
+from drone_vision.pose import Pose
+from drone_vision.zone_index import ZoneIndex
+
+# A stage takes the stream of frames and yields them, one by one, with its work done.
+Stage = Callable[[Iterator[FrameState]], Iterator[FrameState]]
+
+
+def timed_stage(name: str, function: Callable[[FrameState], None]) -> Stage:
+    """
+    Builds a stage that calls 'function' on every frame, timing every call as the instrumentation stage 'name'.
+    """
+
+    def stage(frames: Iterator[FrameState]) -> Iterator[FrameState]:
+        for frame_state in frames:
+            begin = instrumentation.begin_stage()
+            function(frame_state)
+            instrumentation.end_stage(name, begin)
+            yield frame_state
+
+    return stage
+
+
+def get_polygons_calculator(zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache: Optional[InferenceCache] = None) -> Callable[[FrameState], None]:
+    """
+    Builds the function that calculates, with get_inference_polygons, the polygons on a frame that intersect
+    'zones', along with the index of the zone of every polygon.
+    """
+
+    def calculate_polygons(frame_state: FrameState):
+        pose = frame_state.pose
+        zone_indexes: List[int] = []
+        frame_state.polygons = get_inference_polygons(
+            pose.drone_position, pose.inclination_theta, horizontal_FOV, vertical_FOV, pose.drone_to_ground_height,
+            pose.yaw, frame_state.frame, zones, camera_model, projection, cache, zone_indexes)
+        frame_state.zone_indexes = zone_indexes
+        frame_state.metadata["zone_indexes"] = zone_indexes
+        frame_state.metadata["polygons"] = len(frame_state.polygons)
+        frame_state.metadata["vertices"] = sum(len(polygon) for polygon in frame_state.polygons)
+
+    return calculate_polygons
+
+
+def get_frame_masker(mask_pool: MaskBufferPool = MASK_BUFFER_POOL) -> Callable[[FrameState], None]:
+    """
+    Builds the function that paints white, in place, the area of a frame outside its polygons.
+    """
+
+    def mask_frame(frame_state: FrameState):
+        frame_state.frame = getInferenceInterestArea(frame_state.frame, frame_state.polygons, mask_pool)
+
+    return mask_frame
+
+
+def get_polygons_stage(zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache: Optional[InferenceCache] = None) -> Stage:
+    """
+    Builds the stage that calculates the polygons on every frame, see get_polygons_calculator.
+    """
+
+    return timed_stage("polygons_stage", get_polygons_calculator(zones, horizontal_FOV, vertical_FOV, camera_model, projection, cache))
+
+
+def get_mask_stage(mask_pool: MaskBufferPool = MASK_BUFFER_POOL) -> Stage:
+    """
+    Builds the stage that paints white, in place, the area of every frame outside its polygons.
+    """
+
+    return timed_stage("mask_stage", get_frame_masker(mask_pool))
+
+
+def get_detector_stage(detector: Detector, horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel] = None, double_buffered: bool = True) -> Stage:
+    """
+    Builds the stage that runs 'detector' on every masked frame and projects the detections on earth, from the
+    point where every one of them touches the ground.
+
+    Double buffered, the detector runs on its own thread: a frame is sent to the detector as soon as it comes, and
+    then the stage waits for the detections of the previous frame, so the geometry and the mask of every frame
+    run while the detector works on the previous one. Take note that the stages before it work one frame ahead,
+    so the frames shouldn't share their buffers.
+    """
+
+    def project_detections(frame_state: FrameState, detections: np.ndarray):
+        pose = frame_state.pose
+        frame_state.detections = detections
+        frame_state.detections_on_earth = project_detections_on_earth(
+            get_ground_points(detections), pose.drone_position, pose.inclination_theta, horizontal_FOV, vertical_FOV,
+            pose.drone_to_ground_height, pose.yaw, camera_model)
+        frame_state.metadata["detections"] = detections
+        frame_state.metadata["detections_on_earth"] = frame_state.detections_on_earth
+
+    if not double_buffered:
+        return timed_stage("detector_stage", lambda frame_state: project_detections(frame_state, detector.detect(frame_state.frame)))
+
+    def wait_detections(frame_state: FrameState, future: Future):
+        # Only the time the frames wait for the detector, the rest overlaps with the previous stages.
+        begin = instrumentation.begin_stage()
+        detections = future.result()
+        instrumentation.end_stage("detector_wait", begin)
+        project_detections(frame_state, detections)
+
+    def stage(frames: Iterator[FrameState]) -> Iterator[FrameState]:
+        with ThreadPoolExecutor(1) as executor:
+            previous: Optional[Tuple[FrameState, Future]] = None
+            for frame_state in frames:
+                future = executor.submit(detector.detect, frame_state.frame)
+                if previous is not None:
+                    wait_detections(*previous)
+                    yield previous[0]
+                previous = (frame_state, future)
+
+            if previous is not None:
+                wait_detections(*previous)
+                yield previous[0]
+
+    return stage
+
+
+class InferencePipeline(object):
+    """
+    Streams the frames of a video, with the pose of the drone on every one of them, through a list of stages,
+    by default the calculation of the polygons to make inference on and the masking of the frame.
+
+    The stages are chained generators, so a frame goes through every stage before the next frame is read and
+    the memory used doesn't grow with the length of the video. Any stage can be swapped, or added, by changing
+    'stages', like a detector after the mask.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        """
+        Builds the pipeline that runs 'stages' in order.
+        """
+
+        self.stages = stages
+
+    @classmethod
+    def from_zones(cls, zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache: Optional[InferenceCache] = None, mask_pool: MaskBufferPool = MASK_BUFFER_POOL, detector: Optional[Detector] = None) -> 'InferencePipeline':
+        """
+        Builds the default pipeline: the polygons that intersect 'zones' and the mask of the frame, followed by the
+        double buffered stage of 'detector' if given.
+        """
+
+        stages = [get_polygons_stage(zones, horizontal_FOV, vertical_FOV, camera_model, projection, cache),
+                  get_mask_stage(mask_pool)]
+        if detector is not None:
+            stages.append(get_detector_stage(detector, horizontal_FOV, vertical_FOV, camera_model))
+        return cls(stages)
+
+    def process(self, frame_state: FrameState) -> FrameState:
+        """
+        Runs every stage on the single frame 'frame_state'.
+        """
+
+        frames: Iterator[FrameState] = iter([frame_state])
+        for stage in self.stages:
+            frames = stage(frames)
+
+        return next(frames)
+
+    def run_states(self, frames_and_poses: Iterable[Tuple[np.ndarray, Pose]]) -> Iterator[FrameState]:
+        """
+        Yields the state of every frame of 'frames_and_poses' after going through every stage.
+        """
+
+        frames: Iterator[FrameState] = (FrameState(index, frame, pose)
+                                        for index, (frame, pose) in enumerate(frames_and_poses))
+        for stage in self.stages:
+            frames = stage(frames)
+
+        return frames
+
+    def run(self, frames_and_poses: Iterable[Tuple[np.ndarray, Pose]]) -> Iterator[Tuple[np.ndarray, List, dict]]:
+        """
+        Yields (masked frame, polygons, metadata) for every frame of 'frames_and_poses', given as (frame, pose)
+        pairs. Take note that with the default mask stage the frames are masked in place.
+        """
+
+        for frame_state in self.run_states(frames_and_poses):
+            yield frame_state.frame, frame_state.polygons, frame_state.metadata
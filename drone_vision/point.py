@@ -1,7 +1,6 @@
-from math import acos, cos, sin, sqrt
+from math import asin, cos, sin
 import math
-import copy
-from typing import List
+from typing import List, Tuple
 
 COMPLETE_CIRCUNFERENCE = 2*math.pi
 ONE_GRADE_IN_RADIANS = math.pi/180
@@ -11,6 +10,40 @@ EARTH_RADIUS = 6378137
 EPSILON = 0.0000001
 
 
+def calculate_delta_angle(height: float) -> float:
+    """
+    Calculate the angle, in radians, from the drone position on projected plane to a point
+    at 'height' meters on one axis of this projected plane, keeping its polarity. This is the
+    chord formula in the stable form described in geodetic.
+    """
+
+    return 2*asin(height/(2*EARTH_RADIUS))
+
+
+def get_earth_coordinates(x: float, y: float, drone_position: 'point') -> Tuple[float, float]:
+    """
+    Returns the (θ, φ) on earth of (x, y), given on the plane relative to 'drone_position'.
+    """
+
+    delta_theta = calculate_delta_angle(y)*ONE_RADIAN_IN_GRADES
+    delta_phi = calculate_delta_angle(x)*ONE_RADIAN_IN_GRADES
+    return drone_position.x + delta_theta, drone_position.y + delta_phi
+
+
+def get_plane_coordinates(theta: float, phi: float, drone_position: 'point') -> Tuple[float, float]:
+    """
+    Returns the (x, y) on the plane relative to 'drone_position' of (θ, φ), calculated from the
+    deltas in latitude and longitude.
+    """
+
+    delta_theta = theta - drone_position.theta
+    delta_phi = phi - drone_position.phi
+
+    x = 2*EARTH_RADIUS*sin(delta_phi*ONE_GRADE_IN_RADIANS/2)
+    y = 2*EARTH_RADIUS*sin(delta_theta*ONE_GRADE_IN_RADIANS/2)
+    return x, y
+
+
 class point(object):
     """
     Point instance in 3d coordinate system, being one of the following:
@@ -18,6 +51,10 @@ class point(object):
     - (θ, φ, R)
     """
 
+    # The spherical coordinates (θ, φ, R) are views of (x, y, z), so no instance carries a __dict__ nor
+    # a second copy of its coordinates.
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         """
         Point costructor:
@@ -28,10 +65,29 @@ class point(object):
         self.y = y
         self.z = z
 
-        # equally:
-        self.theta = x
-        self.phi = y
-        self.R = z
+    @property
+    def theta(self) -> float:
+        return self.x
+
+    @theta.setter
+    def theta(self, theta: float):
+        self.x = theta
+
+    @property
+    def phi(self) -> float:
+        return self.y
+
+    @phi.setter
+    def phi(self, phi: float):
+        self.y = phi
+
+    @property
+    def R(self) -> float:
+        return self.z
+
+    @R.setter
+    def R(self, R: float):
+        self.z = R
 
     def rotate(self, beta: float):
         """
@@ -39,8 +95,8 @@ class point(object):
         """
         x = self.x*cos(beta) - self.y*sin(beta)
         y = self.x*sin(beta) + self.y*cos(beta)
-        self.x = self.theta = x
-        self.y = self.phi = y
+        self.x = x
+        self.y = y
 
     def translate(self, translation_point: 'point'):
         """
@@ -48,8 +104,6 @@ class point(object):
         """
         self.x += translation_point.x
         self.y += translation_point.y
-        self.theta = self.x
-        self.phi = self.y
         # Z its omitted.
 
     def calculate_delta_latitude(objetive_point: 'point') -> float:
@@ -58,16 +112,7 @@ class point(object):
         i.e. drone on (x=0, y=0, z=0), to objetive point measured on this projected plane.
         """
 
-        latitude_height = objetive_point.y
-        theta = acos(1 - (latitude_height ** 2)/(2*(EARTH_RADIUS ** 2)))
-
-        # Objetive point is practically in the same position as drone
-        if(abs(theta) < EPSILON):
-            return 0.0
-
-        # We maintain the polarity of angle.
-        theta *= latitude_height/abs(latitude_height)
-        return theta
+        return calculate_delta_angle(objetive_point.y)
 
     def calculate_delta_longitude(objetive_point: 'point') -> float:
         """
@@ -75,16 +120,7 @@ class point(object):
         i.e. drone on (x=0, y=0, z=0), to objetive point measured on this projected plane.
         """
 
-        longitude_height = objetive_point.x
-        phi = acos(1 - (longitude_height ** 2)/(2*(EARTH_RADIUS ** 2)))
-
-        # Objetive point is practically in the same position as drone
-        if(abs(phi) < EPSILON):
-            return 0.0
-
-        # We maintain the polarity of angle.
-        phi *= longitude_height/abs(longitude_height)
-        return phi
+        return calculate_delta_angle(objetive_point.x)
 
     def project_point_on_earth(self, drone_position: 'point'):
         """
@@ -92,35 +128,53 @@ class point(object):
         relative to drone_position.
         """
 
-        delta_theta = self.calculate_delta_latitude()*ONE_RADIAN_IN_GRADES
-        delta_phi = self.calculate_delta_longitude()*ONE_RADIAN_IN_GRADES
-        # We need a copy of drone position.
-        new_position: point = copy.deepcopy(drone_position)
-        new_position.translate(point(delta_theta, delta_phi, 0))
-        self.x = self.theta = new_position.x
-        self.y = self.phi = new_position.y
+        self.x, self.y = get_earth_coordinates(self.x, self.y, drone_position)
 
     def project_point_to_plane(self, drone_position: 'point'):
         """
         Project point to planar surface, calculating (x, y, z) from
         drone_position and point with deltas in latitude and longitude.
         """
-        delta_theta = self.theta - drone_position.theta
-        delta_phi = self.phi - drone_position.phi
-        x = 0.0
-        y = 0.0
 
-        if(abs(delta_phi) > 0.000000001):
-            x = EARTH_RADIUS*sqrt(2*(1 - cos(delta_phi*ONE_GRADE_IN_RADIANS)))
-            x *= delta_phi/abs(delta_phi)
+        self.x, self.y = get_plane_coordinates(
+            self.theta, self.phi, drone_position)
+
+    def copy(self) -> 'point':
+        """
+        Returns a new point with the same coordinates.
+        """
+
+        return point(self.x, self.y, self.z)
+
+    def rotated(self, beta: float) -> 'point':
+        """
+        Returns a new point, the actual point rotated by 'beta' radians in counter-clocwise.
+        """
 
-        if(abs(delta_theta) > 0.000000001):
-            y = EARTH_RADIUS * \
-                sqrt(2*(1 - cos(delta_theta*ONE_GRADE_IN_RADIANS)))
-            y *= delta_theta/abs(delta_theta)
+        return point(self.x*cos(beta) - self.y*sin(beta), self.x*sin(beta) + self.y*cos(beta), self.z)
+
+    def translated(self, translation_point: 'point') -> 'point':
+        """
+        Returns a new point, the actual point with its origin translated by 'translation_point'.
+        """
+
+        return point(self.x + translation_point.x, self.y + translation_point.y, self.z)
+
+    def projected_on_earth(self, drone_position: 'point') -> 'point':
+        """
+        Returns a new point, the actual point projected on earth as project_point_on_earth does.
+        """
+
+        theta, phi = get_earth_coordinates(self.x, self.y, drone_position)
+        return point(theta, phi, self.z)
+
+    def projected_to_plane(self, drone_position: 'point') -> 'point':
+        """
+        Returns a new point, the actual point projected to the planar surface as project_point_to_plane does.
+        """
 
-        self.x = self.theta = x
-        self.y = self.phi = y
+        x, y = get_plane_coordinates(self.x, self.y, drone_position)
+        return point(x, y, self.z)
 
     def equal(self, B: 'point') -> bool:
         """
@@ -0,0 +1,106 @@
+from typing import List, Union
+import numpy as np
+
+from drone_vision.geodetic import earth_to_plane, plane_to_earth
+from drone_vision.point import point
+
+
+class PointArray(object):
+    """
+    N points stored as two contiguous float64 columns, 'x' and 'y', being (x, y) or (θ, φ) coordinates like
+    the ones of point. The z coordinate is omitted, as the planar operations do.
+
+    Every operation of point is done here on the whole array at once, so a set of thousands of points
+    doesn't cost thousands of Python objects.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        """
+        Builds the array from the columns 'x' and 'y' of the same size, which are copied.
+        """
+
+        self.x = np.array(x, dtype=np.float64).reshape(-1)
+        self.y = np.array(y, dtype=np.float64).reshape(-1)
+
+    @classmethod
+    def from_points(cls, points: List[point]) -> 'PointArray':
+        """
+        Builds the array from a list of points.
+        """
+
+        return cls([p.x for p in points], [p.y for p in points])
+
+    @classmethod
+    def from_list(cls, points: Union[List[List[float]], np.ndarray]) -> 'PointArray':
+        """
+        Builds the array from points given as [[x1, y1], ..., [xn, yn]] or as a (N, 2) array.
+        """
+
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return cls(points[:, 0], points[:, 1])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, i: int) -> point:
+        return point(float(self.x[i]), float(self.y[i]), 0)
+
+    def __iter__(self):
+        for i in range(0, len(self.x)):
+            yield self[i]
+
+    def to_points(self) -> List[point]:
+        """
+        Returns the array as a list of points.
+        """
+
+        return [point(x, y, 0) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the array as a (N, 2) array of (x, y) coordinates.
+        """
+
+        return np.column_stack((self.x, self.y))
+
+    def rotate(self, beta: float):
+        """
+        Rotates every point by 'beta' radians in counter-clocwise.
+        """
+
+        cos_beta = np.cos(beta)
+        sin_beta = np.sin(beta)
+        x = self.x*cos_beta - self.y*sin_beta
+        self.y = self.x*sin_beta + self.y*cos_beta
+        self.x = x
+
+    def translate(self, translation_point: point):
+        """
+        Translate the origin of every point by 'translation_point'.
+        """
+
+        self.x += translation_point.x
+        self.y += translation_point.y
+
+    def norms(self, origin: point = point(0, 0, 0)) -> np.ndarray:
+        """
+        Calculates the norm of every point to 'origin'.
+        """
+
+        return np.hypot(self.x - origin.x, self.y - origin.y)
+
+    def project_on_earth(self, drone_position: point):
+        """
+        Project every point, given on the plane relative to 'drone_position', on earth, getting its latitude
+        and longitude. It's point.project_point_on_earth done on the whole array.
+        """
+
+        self.x, self.y = plane_to_earth(self.x, self.y, drone_position)
+
+    def project_to_plane(self, drone_position: point):
+        """
+        Project every point, given as (θ, φ), to the planar surface relative to 'drone_position'. It's
+        point.project_point_to_plane done on the whole array.
+        """
+
+        self.x, self.y = earth_to_plane(self.x, self.y, drone_position)
@@ -15,9 +15,16 @@ class PointEntering:
         self.incomplete = incomplete
         self.is_single = is_single
 
+        # Index of the first equal PointEntering in the clipped and the clipping polygon lists of the
+        # Weiler-Atherton algorithm respectively, set once both lists are built.
+        self.clipped_index: int = None
+        self.clipping_index: int = None
+
+    def to_string(self) -> str:
+        return f"{self.P.to_string()} intersection: {self.intersection}; entering: {self.entering}; incomplete: {self.incomplete}; single: {self.is_single}"
+
     def print(self):
-        print(
-            f"{self.P.to_string()} intersection: {self.intersection}; entering: {self.entering}; incomplete: {self.incomplete}; single: {self.is_single}")
+        print(self.to_string())
 
     def equal(self, Q: 'PointEntering') -> bool:
         """
@@ -1,7 +1,11 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from math import sqrt, pi
 
+import numpy as np
+
 from drone_vision.point import point
+from drone_vision.point_array import PointArray
+from drone_vision.polygon_array import get_orientations
 
 EPSILON = 0.00001
 ONE_RADIAN_IN_GRADES = 180/pi
@@ -10,24 +14,32 @@ CLOCKWISE_ORIENTATION = 1
 COUNTERCLOCKWISE_ORIENTATION = 2
 
 
-def vector_norm(vector: point, origin: point = point(0, 0, 0)):
+def vector_norm(vector: Union[point, PointArray], origin: point = point(0, 0, 0)) -> Union[float, np.ndarray]:
     """
-    Calculates the norm of 'vector' to 'origin'.
+    Calculates the norm of 'vector' to 'origin'. If 'vector' is a PointArray, the norm of every point.
     """
+    if isinstance(vector, PointArray):
+        return vector.norms(origin)
+
     norm = sqrt(((vector.x - origin.x) ** 2) +
                 ((vector.y - origin.y) ** 2))
     return norm
 
 
-def get_orientation(A: point, B: point, C: point):
+def get_orientation(A: Union[point, PointArray], B: Union[point, PointArray], C: Union[point, PointArray]):
     """
     Determines the orientation of the points in the order A->B->C, returning one of the 
     following results:
     - 0 : the points were collinear.
     - 1 : the points were clockwise.
     - 2 : the points were counterclockwise.
+
+    If any of them is a PointArray, returns the orientation of every triple of points as an array.
     """
 
+    if isinstance(A, PointArray) or isinstance(B, PointArray) or isinstance(C, PointArray):
+        return get_orientations(A, B, C)
+
     a1 = A.y - B.y
     b1 = B.x - A.x
 
@@ -0,0 +1,88 @@
+from typing import List
+import numpy as np
+
+from drone_vision.point import point
+from drone_vision.point_array import PointArray
+
+EPSILON = 0.00001
+COLLINEAR_ORIENTATION = 0
+CLOCKWISE_ORIENTATION = 1
+COUNTERCLOCKWISE_ORIENTATION = 2
+
+
+def get_orientations(A: PointArray, B: PointArray, C: PointArray) -> np.ndarray:
+    """
+    Determines the orientation of every triple of points A[i]->B[i]->C[i], as get_orientation does, returning
+    an array of COLLINEAR_ORIENTATION, CLOCKWISE_ORIENTATION and COUNTERCLOCKWISE_ORIENTATION values.
+    """
+
+    a1 = A.y - B.y
+    b1 = B.x - A.x
+
+    a2 = B.y - C.y
+    b2 = C.x - B.x
+
+    val = a2*b1 - a1*b2
+
+    orientations = np.where(val > 0.0, CLOCKWISE_ORIENTATION,
+                            COUNTERCLOCKWISE_ORIENTATION)
+    orientations[np.abs(val) < EPSILON] = COLLINEAR_ORIENTATION
+    return orientations
+
+
+class PolygonArray(PointArray):
+    """
+    Polygon stored as a PointArray of its vertices, where the last vertex is joined to the first one.
+    """
+
+    @classmethod
+    def from_polygon(cls, polygon: List[List[float]], drone_position: point) -> 'PolygonArray':
+        """
+        Builds the polygon from 'polygon' given as [[θ1, φ1], ..., [θn, φn]], projected on the plane
+        relative to 'drone_position'. It's format_polygon done on the whole polygon.
+        """
+
+        polygon_array = cls.from_list(polygon)
+        polygon_array.project_to_plane(drone_position)
+        return polygon_array
+
+    def next_vertices(self) -> PointArray:
+        """
+        Returns the vertex that follows every vertex, i.e. the end of every segment of the polygon.
+        """
+
+        return PointArray(np.roll(self.x, -1), np.roll(self.y, -1))
+
+    def previous_vertices(self) -> PointArray:
+        """
+        Returns the vertex that precedes every vertex.
+        """
+
+        return PointArray(np.roll(self.x, 1), np.roll(self.y, 1))
+
+    def area(self) -> float:
+        """
+        Calculates the signed area of the polygon, negative when it's clockwise.
+        """
+
+        next_x = np.roll(self.x, -1)
+        next_y = np.roll(self.y, -1)
+        return float(np.sum(self.x*next_y - next_x*self.y)/2)
+
+    def vertex_orientations(self) -> np.ndarray:
+        """
+        Determines the orientation of the turn on every vertex, i.e. of the previous vertex, the vertex and
+        the next vertex.
+        """
+
+        return get_orientations(self.previous_vertices(), self, self.next_vertices())
+
+    def sort_clockwise(self) -> 'PolygonArray':
+        """
+        Returns the polygon in clockwise order, the polygon itself if it already is.
+        """
+
+        if self.area() < 0:
+            return self
+
+        return PolygonArray(self.x[::-1], self.y[::-1])
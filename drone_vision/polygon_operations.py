@@ -1,47 +1,65 @@
-import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
+import numpy as np
 
+from drone_vision import tracing
+from drone_vision.camera_model import CameraModel
+from drone_vision.geodetic import earth_to_plane
 from drone_vision.geometric_operations import project_point_on_camera_frame
 from drone_vision.point import point
+from drone_vision.point_array import PointArray
+from drone_vision.polygon_array import PolygonArray
 from drone_vision.quadrilateral import quadrilateral
 from drone_vision.points_operations import get_orientation
-from drone_vision.lines_operations import point_on_segment, angle_between_segments
+from drone_vision.lines_operations import point_on_segment
 
 EPSILON = 0.00001
+COLLINEAR_ORIENTATION = 0
 CLOCKWISE_ORIENTATION = 1
 COUNTERCLOCKWISE_ORIENTATION = 2
+# Under this number of points, projecting a polygon point by point is faster than building the arrays.
+VECTORIZED_POLYGON_SIZE = 20
 
 
-def project_polygon_on_camera_frame(horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, frame_width: int, frame_height: int, camera_vision: quadrilateral, polygon: List[point]) -> List[List[float]]:
+def project_polygon_on_camera_frame(horizontal_FOV: float, vertical_FOV: float, drone_to_ground_height: float, frame_width: int, frame_height: int, camera_vision: quadrilateral, polygon: List[point], camera_model: Optional[CameraModel] = None) -> List[List[float]]:
     """
     Project 'polygon' in the camera frame by calculating the angles formed in drone_position to ground
     and the leftmost line of projected 'camera_vision' on the ground so we can indicate what the drone
-    is seeing in the ground on its frame.
+    is seeing in the ground on its frame. See project_point_on_camera_frame for 'camera_model'.
     """
 
     polygon_projected_on_frame = []
 
     for p in polygon:
         polygon_projected_on_frame.append(project_point_on_camera_frame(
-            horizontal_FOV, vertical_FOV, drone_to_ground_height, frame_width, frame_height, camera_vision, p))
+            horizontal_FOV, vertical_FOV, drone_to_ground_height, frame_width, frame_height, camera_vision, p, camera_model))
 
     return polygon_projected_on_frame
 
 
-def format_polygon(polygon: List[List[float]], drone_position: point) -> List[point]:
+def format_polygon(polygon: List[List[float]], drone_position: point, as_array: bool = False) -> Union[List[point], PolygonArray]:
     """
     Transform all the points of 'polygon' to custom class point (θ, φ, R)
-    and project the point on plane relative to 'drone_position'.
+    and project the point on plane relative to 'drone_position'. Polygons of VECTORIZED_POLYGON_SIZE
+    points or more are projected at once, and if 'as_array' it's returned as a PolygonArray.
     """
 
-    formatted_polygon: List[point] = []
+    if as_array:
+        return PolygonArray.from_polygon(polygon, drone_position)
 
-    for p in polygon:
-        formatted_point = point(p[0], p[1], 0)
-        formatted_point.project_point_to_plane(drone_position)
-        formatted_polygon.append(formatted_point)
+    if len(polygon) < VECTORIZED_POLYGON_SIZE:
+        formatted_polygon: List[point] = []
+
+        for p in polygon:
+            formatted_point = point(p[0], p[1], 0)
+            formatted_point.project_point_to_plane(drone_position)
+            formatted_polygon.append(formatted_point)
+
+        return formatted_polygon
 
-    return formatted_polygon
+    coordinates = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    xs, ys = earth_to_plane(coordinates[:, 0], coordinates[:, 1], drone_position)
+
+    return [point(x, y, 0) for x, y in zip(xs.tolist(), ys.tolist())]
 
 
 def delete_collinear_segments(polygon: List[point]) -> bool:
@@ -82,27 +100,101 @@ def delete_collinear_segments(polygon: List[point]) -> bool:
 
 def point_in_polygon(P: point, polygon: List[point]) -> bool:
     """
-    Determines whether or not some point 'p' is inside the given 'polygon'.
+    Determines whether or not some point 'p' is inside the given 'polygon' (its perimeter included), by
+    counting how many times the polygon winds around 'P'.
     """
 
-    angle_sum = 0
+    winding_number = 0
 
     for i in range(0, len(polygon)):
-        j = (i + 1) % len(polygon)
-        if point_on_segment(P, polygon[i], polygon[j]):
+        A = polygon[i]
+        B = polygon[(i + 1) % len(polygon)]
+        if point_on_segment(P, A, B):
             return True
 
-        orientation = get_orientation(polygon[i], P, polygon[j])
+        # Cross product of AB and AP, positive when 'P' is on the left of AB.
+        side = (B.x - A.x)*(P.y - A.y) - (P.x - A.x)*(B.y - A.y)
 
-        if orientation == COUNTERCLOCKWISE_ORIENTATION:
-            angle_sum += angle_between_segments(polygon[i], P, polygon[j])
-        else:
-            angle_sum -= angle_between_segments(polygon[i], P, polygon[j])
+        if A.y <= P.y:
+            # AB crosses upwards the horizontal line of 'P' on its right.
+            if B.y > P.y and side > 0:
+                winding_number += 1
+        elif B.y <= P.y and side < 0:
+            # AB crosses downwards the horizontal line of 'P' on its right.
+            winding_number -= 1
 
-    if abs(angle_sum) > math.pi:
-        return True
+    return winding_number != 0
 
-    return False
+
+def points_in_polygon(points: Union[np.ndarray, PointArray, List[point]], polygon: Union[np.ndarray, PointArray, List[point]]) -> np.ndarray:
+    """
+    Batched version of point_in_polygon: determines for every one of the N 'points', given as a (N, 2) array or
+    a list of points, whether or not it is inside 'polygon' (its perimeter included). Returns a boolean array of
+    size N.
+    """
+
+    points = points_to_array(points)
+    polygon = points_to_array(polygon)
+
+    # Every point (rows) against every segment AB (columns).
+    Px = points[:, 0:1]
+    Py = points[:, 1:2]
+    Ax = polygon[:, 0]
+    Ay = polygon[:, 1]
+    Bx = np.roll(Ax, -1)
+    By = np.roll(Ay, -1)
+
+    # Same tolerance as point_on_segment.
+    on_line = np.abs((Ay - By)*Px + (Bx - Ax)*Py + (Ax*By - Ay*Bx)) < EPSILON
+    in_box = (np.minimum(Ax, Bx) < Px + EPSILON) & (np.maximum(Ax, Bx) > Px - EPSILON) & \
+        (np.minimum(Ay, By) < Py + EPSILON) & (np.maximum(Ay, By) > Py - EPSILON)
+    on_perimeter = np.any(on_line & in_box, axis=1)
+
+    side = (Bx - Ax)*(Py - Ay) - (Px - Ax)*(By - Ay)
+    upwards = (Ay <= Py) & (By > Py) & (side > 0)
+    downwards = (Ay > Py) & (By <= Py) & (side < 0)
+    winding_number = np.count_nonzero(
+        upwards, axis=1) - np.count_nonzero(downwards, axis=1)
+
+    return on_perimeter | (winding_number != 0)
+
+
+def points_to_array(points: Union[np.ndarray, PointArray, List[point]]) -> np.ndarray:
+    """
+    Returns 'points', given as a (N, 2) array, a PointArray or a list of points, as a (N, 2) array of
+    float64 (x, y) coordinates.
+    """
+
+    if isinstance(points, np.ndarray):
+        return np.asarray(points[:, :2], dtype=np.float64)
+    if isinstance(points, PointArray):
+        return points.to_array()
+
+    return np.array([[p.x, p.y] for p in points], dtype=np.float64).reshape(-1, 2)
+
+
+def is_convex_polygon(polygon: List[point]) -> bool:
+    """
+    Determines whether or not 'polygon' is convex, i.e. every turn between its contiguous segments has the same orientation.
+    """
+
+    polygon_orientation = COLLINEAR_ORIENTATION
+
+    for i in range(0, len(polygon)):
+        A = polygon[(i - 1 + len(polygon)) % len(polygon)]
+        B = polygon[i]
+        C = polygon[(i + 1) % len(polygon)]
+        orientation = get_orientation(A, B, C)
+
+        if orientation == COLLINEAR_ORIENTATION:
+            continue
+        if polygon_orientation == COLLINEAR_ORIENTATION:
+            polygon_orientation = orientation
+        elif orientation != polygon_orientation:
+            return False
+
+    # Every point is collinear, it's not a polygon.
+    return polygon_orientation != COLLINEAR_ORIENTATION
 
 
 def rotate_polygon(polygon: List[point]) -> List[point]:
@@ -127,27 +219,34 @@ def point_in_polygon_perimeter(P: point, polygon: List[point]) -> bool:
     return False
 
 
-def polygon_area(polygon: List[point]) -> float:
+def polygon_area(polygon: Union[List[point], PolygonArray]) -> float:
     """
     Calculates the area of 'polygon'.
     """
-    area = 0.0
+    if isinstance(polygon, PolygonArray):
+        area = polygon.area()
+    else:
+        area = 0.0
 
-    for i in range(0, len(polygon)):
-        A = polygon[i]
-        B = polygon[(i + 1) % len(polygon)]
+        for i in range(0, len(polygon)):
+            A = polygon[i]
+            B = polygon[(i + 1) % len(polygon)]
 
-        area += (A.x*B.y - B.x*A.y)/2
+            area += (A.x*B.y - B.x*A.y)/2
 
-    print(f"Polygon area = {area}")
+    if tracing.is_enabled(tracing.DEBUG):
+        tracing.trace(tracing.DEBUG, f"Polygon area = {area}")
     return area
 
 
-def sort_clockwise_polygon(polygon: List[point]) -> List[point]:
+def sort_clockwise_polygon(polygon: Union[List[point], PolygonArray]) -> Union[List[point], PolygonArray]:
     """
     Sorts 'polygon' in clockwise order.
     """
 
+    if isinstance(polygon, PolygonArray):
+        return polygon.sort_clockwise()
+
     area = polygon_area(polygon)
 
     if(area < 0):
@@ -156,7 +255,7 @@ def sort_clockwise_polygon(polygon: List[point]) -> List[point]:
     sorted_polygon: List[point] = []
 
     for i in range(len(polygon) - 1, -1, -1):
-        sorted_polygon.apdrone_vision.pend(polygon[i])
+        sorted_polygon.append(polygon[i])
 
     return sorted_polygon
 
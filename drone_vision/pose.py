@@ -0,0 +1,15 @@
+from typing import NamedTuple
+
+from drone_vision.point import point
+
+
+class Pose(NamedTuple):
+    """
+    Pose of the drone when a frame was taken: its position (θ, φ, R), the inclination of the camera, the height
+    from the drone to the ground and the yaw, the angles given in grades.
+    """
+
+    drone_position: point
+    inclination_theta: float
+    drone_to_ground_height: float
+    yaw: float
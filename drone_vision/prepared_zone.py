@@ -0,0 +1,65 @@
+from typing import List
+
+from drone_vision.point import point
+from drone_vision.polygon_operations import format_polygon, sort_clockwise_polygon, delete_collinear_segments
+from drone_vision.zone_index import BoundingBox, get_bounding_box
+
+
+class PreparedZone(object):
+    """
+    Restriction zone given in (θ, φ) coordinates with the work that doesn't depend on the drone pose done once:
+    clockwise order, deletion of collinear points and bounding boxes.
+
+    The zone is projected on a plane relative to its own 'reference' point, so on every frame it only has
+    to be translated to be seen from the drone position.
+    """
+
+    def __init__(self, polygon: List[List[float]]):
+        """
+        Prepares 'polygon' given as [[θ1, φ1], ..., [θn, φn]].
+        """
+
+        self.polygon = polygon
+        self.bounding_box: BoundingBox = get_bounding_box(polygon)
+
+        min_theta, min_phi, max_theta, max_phi = self.bounding_box
+        self.reference = point((min_theta + max_theta)/2,
+                               (min_phi + max_phi)/2, 0)
+
+        local_polygon = format_polygon(polygon, self.reference)
+        local_polygon = delete_collinear_segments(
+            sort_clockwise_polygon(local_polygon))
+
+        # Coordinates of the cleaned polygon on the plane relative to 'reference'.
+        self.local_polygon: List[point] = local_polygon
+        xs = [p.x for p in local_polygon]
+        ys = [p.y for p in local_polygon]
+        self.local_bounding_box: BoundingBox = (
+            min(xs), min(ys), max(xs), max(ys))
+
+    def __len__(self) -> int:
+        return len(self.local_polygon)
+
+    def get_offset(self, drone_position: point) -> point:
+        """
+        Returns the position of 'reference' on the plane relative to 'drone_position'.
+        """
+
+        offset = point(self.reference.x, self.reference.y, 0)
+        offset.project_point_to_plane(drone_position)
+        return offset
+
+    def get_plane_bounding_box(self, offset: point) -> BoundingBox:
+        """
+        Returns the bounding box of the zone on the plane where 'reference' is on 'offset'.
+        """
+
+        min_x, min_y, max_x, max_y = self.local_bounding_box
+        return min_x + offset.x, min_y + offset.y, max_x + offset.x, max_y + offset.y
+
+    def to_plane(self, offset: point) -> List[point]:
+        """
+        Returns the cleaned clockwise polygon on the plane where 'reference' is on 'offset'.
+        """
+
+        return [point(p.x + offset.x, p.y + offset.y, 0) for p in self.local_polygon]
@@ -1,5 +1,5 @@
 import math
-from typing import List
+from typing import List, Tuple
 from drone_vision.point import point
 
 COMPLETE_CIRCUNFERENCE = 2*math.pi
@@ -71,9 +71,61 @@ class quadrilateral(object):
         self.C.project_point_to_plane(self.drone_position)
         self.D.project_point_to_plane(self.drone_position)
 
+    def copy(self) -> 'quadrilateral':
+        """
+        Returns a new quadrilateral with copies of the points, seen from the same drone position.
+        """
+
+        return quadrilateral(self.A.copy(), self.B.copy(), self.C.copy(), self.D.copy(), self.drone_position)
+
+    def rotated(self, rotation_angle: float) -> 'quadrilateral':
+        """
+        Returns a new quadrilateral, the actual one rotated as rotate does.
+        """
+
+        BETA = COMPLETE_CIRCUNFERENCE - rotation_angle*ONE_GRADE_IN_RADIANS
+        return quadrilateral(self.A.rotated(BETA), self.B.rotated(BETA), self.C.rotated(BETA), self.D.rotated(BETA),
+                             self.drone_position)
+
+    def translated(self, origin_point: point) -> 'quadrilateral':
+        """
+        Returns a new quadrilateral, the actual one translated as translate does.
+        """
+
+        return quadrilateral(self.A.translated(origin_point), self.B.translated(origin_point),
+                             self.C.translated(origin_point), self.D.translated(origin_point), self.drone_position)
+
+    def projected_on_earth(self) -> 'quadrilateral':
+        """
+        Returns a new quadrilateral with the (θ, φ, R) coordinates of the actual one, as project_on_earth does.
+        """
+
+        return quadrilateral(self.A.projected_on_earth(self.drone_position), self.B.projected_on_earth(self.drone_position),
+                             self.C.projected_on_earth(self.drone_position), self.D.projected_on_earth(self.drone_position),
+                             self.drone_position)
+
+    def projected_on_plane(self) -> 'quadrilateral':
+        """
+        Returns a new quadrilateral with the (x, y, z) coordinates of the actual one, as project_on_plane does.
+        """
+
+        return quadrilateral(self.A.projected_to_plane(self.drone_position), self.B.projected_to_plane(self.drone_position),
+                             self.C.projected_to_plane(self.drone_position), self.D.projected_to_plane(self.drone_position),
+                             self.drone_position)
+
     def to_weilmar_atherton_representation(self) -> List[point]:
         """
         Represent the quadrilateral as a list of points.
         """
 
         return [self.A, self.B, self.D, self.C]
+
+    def get_bounding_box(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the bounding box (min_x, min_y, max_x, max_y) of the quadrilateral, equally
+        (min_θ, min_φ, max_θ, max_φ) once it's projected on earth.
+        """
+
+        xs = [self.A.x, self.B.x, self.C.x, self.D.x]
+        ys = [self.A.y, self.B.y, self.C.y, self.D.y]
+        return min(xs), min(ys), max(xs), max(ys)
@@ -0,0 +1,122 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+import os
+import numpy as np
+
+from drone_vision.camera_model import CameraModel
+from drone_vision.frame_ring_buffer import FrameRingBuffer
+from drone_vision.frame_state import FrameState
+from drone_vision.inference_interest_area import ANGULAR_PROJECTION
+from drone_vision.parallel_executor import FRAMES_IN_FLIGHT_PER_WORKER, get_worker_pipeline
+from drone_vision.pipeline import InferencePipeline
+from drone_vision.pose import Pose
+from drone_vision.zone_index import ZoneIndex
+
+# Ring and pipeline of the worker process, built once by the initializer of the pool.
+_worker_ring: Optional[FrameRingBuffer] = None
+_worker_pipeline: Optional[InferencePipeline] = None
+
+
+def _initialize_worker(ring_parameters: Tuple[str, int, int, int, int], *pipeline_parameters):
+    global _worker_ring, _worker_pipeline
+
+    _worker_ring = FrameRingBuffer.attach(*ring_parameters)
+    _worker_pipeline = get_worker_pipeline(*pipeline_parameters)
+
+
+def _process_slot(index: int, slot: int, pose: Pose) -> Tuple[List, dict]:
+    """
+    Runs the pipeline of the worker process, in place, on the frame number 'index' written on 'slot'.
+    """
+
+    frame_state = _worker_pipeline.process(FrameState(index, _worker_ring[slot], pose))
+
+    return frame_state.polygons, frame_state.metadata
+
+
+class SharedFrameExecutor(object):
+    """
+    Runs the default InferencePipeline on a pool of processes like ParallelFrameExecutor, but with the frames
+    on a FrameRingBuffer: the producer writes every frame on a slot of the ring, a worker masks it in place and
+    the consumer reads it from the same slot, so only the index of the slot and the pose are sent to the
+    workers, and only the polygons and the metadata are sent back.
+
+    The ring has a slot for every frame in flight and one more for the frame being read by the consumer, so
+    a slot is only written again after its frame has been consumed.
+    """
+
+    def __init__(self, zones: Union[List[List[List[float]]], ZoneIndex], horizontal_FOV: float, vertical_FOV: float, height: int, width: int, channels: int = 3, workers: Optional[int] = None, max_in_flight: Optional[int] = None, camera_model: Optional[CameraModel] = None, projection: str = ANGULAR_PROJECTION, cache_size: int = 0, mask: bool = True):
+        """
+        Creates the ring of frames of 'height' * 'width' * 'channels' and starts a pool of 'workers' processes (one
+        per core by default), with the same parameters as ParallelFrameExecutor.
+        """
+
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.max_in_flight = max_in_flight if max_in_flight is not None else FRAMES_IN_FLIGHT_PER_WORKER*self.workers
+        self.ring = FrameRingBuffer(self.max_in_flight + 1, height, width, channels)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_initialize_worker,
+                                        initargs=(self.ring.get_parameters(), zones, horizontal_FOV, vertical_FOV,
+                                                  camera_model, projection, cache_size, mask))
+
+    def __enter__(self) -> 'SharedFrameExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Waits for the frames on the pool, stops the workers and frees the ring.
+        """
+
+        self.pool.shutdown(wait=True)
+        self.ring.unlink()
+
+    def run_in_place(self, write_frame: Callable[[np.ndarray], Optional[Pose]]) -> Iterator[Tuple[np.ndarray, List, dict]]:
+        """
+        Yields (masked frame, polygons, metadata) for every frame, in order, calling 'write_frame' with a free slot
+        of the ring to write the next frame on it (for instance with cv2.VideoCapture.read(slot)). 'write_frame'
+        returns the pose of the frame, or None when there are no more frames.
+
+        The masked frame is the slot of the ring, so it's only valid until the next frame is requested.
+        """
+
+        in_flight: Deque = deque()
+        index = 0
+        while True:
+            if len(in_flight) >= self.max_in_flight:
+                yield self.get_result(*in_flight.popleft())
+                continue
+
+            slot = index % len(self.ring)
+            pose = write_frame(self.ring[slot])
+            if pose is None:
+                break
+            in_flight.append((slot, self.pool.submit(_process_slot, index, slot, pose)))
+            index += 1
+
+        while in_flight:
+            yield self.get_result(*in_flight.popleft())
+
+    def run(self, frames_and_poses: Iterable[Tuple[np.ndarray, Pose]]) -> Iterator[Tuple[np.ndarray, List, dict]]:
+        """
+        Yields (masked frame, polygons, metadata) for every frame of 'frames_and_poses', copying every frame on the
+        ring once. Use run_in_place to decode the frames straight on the ring instead.
+        """
+
+        frames_and_poses = iter(frames_and_poses)
+
+        def write_frame(slot_frame: np.ndarray) -> Optional[Pose]:
+            frame_and_pose = next(frames_and_poses, None)
+            if frame_and_pose is None:
+                return None
+            np.copyto(slot_frame, frame_and_pose[0])
+            return frame_and_pose[1]
+
+        return self.run_in_place(write_frame)
+
+    def get_result(self, slot: int, future) -> Tuple[np.ndarray, List, dict]:
+        polygons, metadata = future.result()
+        metadata["slot"] = slot
+        return self.ring[slot], polygons, metadata
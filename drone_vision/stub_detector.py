@@ -0,0 +1,32 @@
+import time
+import numpy as np
+
+from drone_vision.detector import Detector
+
+DEFAULT_LATENCY = 0.025  # Seconds, about a yolo model on a GPU.
+DEFAULT_DETECTIONS = 5
+# Size of the boxes, normalized by the frame size.
+BOX_SIZE = 0.05
+
+
+class StubDetector(Detector):
+    """
+    Detector that takes 'latency' seconds per frame, without a model, to test and benchmark the detector stage
+    without a GPU. Like a call to a GPU, the wait releases the GIL, so the geometry of the next frame can run at
+    the same time.
+
+    The detections are random boxes on the bottom half of the frame, the same ones for every run.
+    """
+
+    def __init__(self, latency: float = DEFAULT_LATENCY, detections: int = DEFAULT_DETECTIONS, seed: int = 0):
+        self.latency = latency
+        self.detections = detections
+        self.rng = np.random.default_rng(seed)
+
+    def detect(self, frame: np.ndarray) -> np.ndarray:
+        time.sleep(self.latency)
+
+        x_min = self.rng.uniform(0, 1 - BOX_SIZE, self.detections)
+        y_min = self.rng.uniform(0.5, 1 - BOX_SIZE, self.detections)
+        confidence = self.rng.uniform(0.5, 1, self.detections)
+        return np.column_stack((x_min, y_min, x_min + BOX_SIZE, y_min + BOX_SIZE, confidence))
@@ -0,0 +1,86 @@
+"""
+Cross-checks the convex clipping against the Weiler-Atherton algorithm on the cases of testing_polygon_clipping.py,
+and calculate_polygon_intersection with the cases given as a list of points and as a PolygonArray.
+
+Run from the repository root with: python -m drone_vision.testing_convex_clipping
+"""
+from typing import List
+
+from drone_vision.point import point
+from drone_vision.polygon_operations import polygon_area
+from drone_vision.polygon_array import PolygonArray
+from drone_vision.weiler_atherton_algorithm import calculate_polygon_intersection, get_intersection_polygons
+from drone_vision.convex_clipping import delete_degenerated_polygons, get_convex_intersection_polygons
+from drone_vision import testing_polygon_clipping as cases
+
+# Offsets avoid sampling points that lie exactly on the segments of the cases.
+GRID_STEP = 0.1
+GRID_OFFSET = 0.0137
+CASES = ["Polygon", "Polygon_ccw"] + [f"Polygon{i}" for i in range(2, 25)]
+
+
+def total_area(polygons: List[List[point]]) -> float:
+    area = 0.0
+    for polygon in polygons:
+        if len(polygon) > 2:
+            area += abs(polygon_area(polygon))
+    return area
+
+
+def sample_in_polygon(P: point, polygon: List[point]) -> bool:
+    """
+    Even-odd test, independent of polygon_operations. Samples never lie on a segment so the border is not handled.
+    """
+
+    inside = False
+    for i in range(0, len(polygon)):
+        A = polygon[i]
+        B = polygon[(i + 1) % len(polygon)]
+        if (A.y > P.y) != (B.y > P.y) and P.x < A.x + (P.y - A.y)*(B.x - A.x)/(B.y - A.y):
+            inside = not inside
+    return inside
+
+
+def to_coordinates(polygons: List[List[point]]) -> List[List[tuple]]:
+    return [[(p.x, p.y) for p in polygon] for polygon in polygons or []]
+
+
+def count_wrong_samples(clipped_polygon: List[point], clipping_polygon: List[point], polygons: List[List[point]]) -> int:
+    """
+    Counts the points of a grid where 'polygons' disagree with being inside both 'clipped_polygon' and 'clipping_polygon'.
+    """
+
+    wrong = 0
+    for i in range(-20, 140):
+        for j in range(-20, 140):
+            P = point(i*GRID_STEP + GRID_OFFSET, j*GRID_STEP + GRID_OFFSET, 0)
+            expected = sample_in_polygon(P, clipped_polygon) and sample_in_polygon(P, clipping_polygon)
+            result = any(sample_in_polygon(P, polygon) for polygon in polygons)
+            if expected != result:
+                wrong += 1
+    return wrong
+
+
+if __name__ == "__main__":
+    camera_polygon = cases.camera.to_weilmar_atherton_representation()
+
+    for name in CASES:
+        polygon = getattr(cases, name)
+        weiler_atherton = get_intersection_polygons(camera_polygon, polygon)
+        convex = get_convex_intersection_polygons(camera_polygon, polygon)
+        weiler_atherton_area = total_area(weiler_atherton)
+        convex_area = total_area(convex)
+        weiler_atherton_wrong = count_wrong_samples(camera_polygon, polygon, weiler_atherton)
+        convex_wrong = count_wrong_samples(camera_polygon, polygon, convex)
+
+        same_area = abs(weiler_atherton_area - convex_area) < 0.0001
+        # Weiler-Atherton may return pieces without area, which the convex clipping deletes.
+        same_count = len(delete_degenerated_polygons(weiler_atherton)) == len(convex)
+        print(f"{name}: Weiler-Atherton area {weiler_atherton_area:.4f} ({weiler_atherton_wrong} wrong samples), "
+              f"convex area {convex_area:.4f} ({convex_wrong} wrong samples), same area: {same_area}, "
+              f"same polygon count: {same_count}")
+        has_intersection, intersections = calculate_polygon_intersection(cases.camera, polygon)
+        array_has_intersection, array_intersections = calculate_polygon_intersection(cases.camera, PolygonArray.from_points(polygon))
+        print(f"    same with PolygonArray: {has_intersection == array_has_intersection and to_coordinates(intersections) == to_coordinates(array_intersections)}")
+        for intersection_polygon in convex:
+            print("    " + ", ".join(f"({p.to_string()})" for p in intersection_polygon))
@@ -0,0 +1,45 @@
+"""
+Checks project_detections_on_earth against the depression of every row of the frame: with yaw 0 the detections
+are north of the drone at height/tan(depression) meters, and the rows on or above the horizon are NaN, also for
+the poses where the frame sees the horizon.
+
+Run from the repository root with: python -m drone_vision.testing_detections_on_earth
+"""
+from math import radians, tan
+import numpy as np
+
+from drone_vision.camera_projections import project_detections_on_earth
+from drone_vision.geodetic import earth_to_plane
+from drone_vision.point import point
+
+EARTH_RADIUS = 6378137
+DRONE_POSITION = point(3.5572512, -76.4239383, EARTH_RADIUS)
+HORIZONTAL_FOV = 90
+VERTICAL_FOV = 60
+HEIGHT = 30
+# Normalized rows, 0 being the top of the frame.
+ROWS = np.linspace(0, 1, 11)
+INCLINATIONS = [-75, -45, -31, -30, -20, 0, 10, 40]
+# Meters, relative to the forward distance.
+TOLERANCE = 0.0001
+
+
+if __name__ == "__main__":
+    for inclination_theta in INCLINATIONS:
+        detections = np.column_stack((np.full(len(ROWS), 0.5), ROWS))
+        on_earth = project_detections_on_earth(detections, DRONE_POSITION, inclination_theta, HORIZONTAL_FOV,
+                                               VERTICAL_FOV, HEIGHT, 0)
+        _, forward_distances = earth_to_plane(on_earth[:, 0], on_earth[:, 1], DRONE_POSITION)
+
+        # Depression of every row from the horizon, in grades.
+        depressions = ROWS*VERTICAL_FOV - VERTICAL_FOV/2 - inclination_theta
+        below_horizon = depressions > 0
+        expected = np.array([HEIGHT/tan(radians(depression)) if is_below else np.nan
+                             for depression, is_below in zip(depressions, below_horizon)])
+
+        same_nan = bool(np.array_equal(np.isnan(forward_distances), ~below_horizon))
+        errors = np.abs(forward_distances[below_horizon] - expected[below_horizon])/np.abs(expected[below_horizon])
+        same_distances = bool(np.all(errors < TOLERANCE))
+        print(f"inclination {inclination_theta}: {int(np.sum(~below_horizon))} rows on or above the horizon, "
+              f"NaN on them: {same_nan}, right forward distances: {same_distances}")
+        assert same_nan and same_distances
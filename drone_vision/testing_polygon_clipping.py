@@ -1,8 +1,8 @@
 import math
 
-from point import point
-from quadrilateral import quadrilateral
-from weiler_atherton_algorithm import calculate_polygon_intersection
+from drone_vision.point import point
+from drone_vision.quadrilateral import quadrilateral
+from drone_vision.weiler_atherton_algorithm import calculate_polygon_intersection
 
 COMPLETE_CIRCUNFERENCE = 2*math.pi
 ONE_GRADE_IN_RADIANS = math.pi/180
@@ -49,10 +49,6 @@ S24 = point(8, 8, 0)
 ALlPoints = [S1, S2, S3, S4, S5, S6, S7, S8, S9, S10, S11, S12,
              S13, S14, S15, S16, S17, S18, S19, S20, S21, S22, S23, S24]
 
-for i in range(0, len(ALlPoints)):
-    p = ALlPoints[i]
-    print(f"S{i + 1} = ({p.x:.2f}, {p.y:.2f})")
-
 # Every polygon segment is given in clockwise order
 Polygon = [S1, S7, S6, S5, S4, S3, S2]
 Polygon_ccw = [S2, S3, S4, S5, S6, S7, S1]
@@ -80,84 +76,89 @@ Polygon22 = [S18, S8, S17]
 Polygon23 = [S17, S20, S23]
 Polygon24 = [S20, S6, S12, S3, S13, S14, S5, B]
 
-# gives [[(6.80 5.20), (6.00 3.50), (6.00 6.00)], [(5.18 6.82), (3.00 5.00), (3.36 8.64)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon)
+if __name__ == "__main__":
+    for i in range(0, len(ALlPoints)):
+        p = ALlPoints[i]
+        print(f"S{i + 1} = ({p.x:.2f}, {p.y:.2f})")
+
+    # gives [[(6.80 5.20), (6.00 3.50), (6.00 6.00)], [(5.18 6.82), (3.00 5.00), (3.36 8.64)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon)
 
-# gives [[(5.00 7.00), (3.00 5.00), (3.36 8.64)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon2)
+    # gives [[(5.00 7.00), (3.00 5.00), (3.36 8.64)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon2)
 
-# gives [[(7.74 2.58), (2.16 6.49), (3.00 9.00), (9.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon3)
+    # gives [[(7.74 2.58), (2.16 6.49), (3.00 9.00), (9.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon3)
 
-# gives [[(3.36 8.64), (3.00 5.00), (5.00 7.00), (9.00 3.00), (6.82 2.27), (1.47 4.41), (3.00 9.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon4)
+    # gives [[(3.36 8.64), (3.00 5.00), (5.00 7.00), (9.00 3.00), (6.82 2.27), (1.47 4.41), (3.00 9.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon4)
 
-# gives [[(3.00 5.00), (6.00 3.50), (3.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon5)
+    # gives [[(3.00 5.00), (6.00 3.50), (3.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon5)
 
-# gives [[(3.00 9.00), (9.00 3.00), (3.00 1.00), (1.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon6)
+    # gives [[(3.00 9.00), (9.00 3.00), (3.00 1.00), (1.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon6)
 
-# gives [[(1.82 2.18), (5.45 6.55), (9.00 3.00), (3.00 1.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon7)
+    # gives [[(1.82 2.18), (5.45 6.55), (9.00 3.00), (3.00 1.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon7)
 
-# gives [[(6.23 2.08), (3.00 3.00), (3.00 9.00), (9.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon8)
+    # gives [[(6.23 2.08), (3.00 3.00), (3.00 9.00), (9.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon8)
 
-# gives [[(7.00 5.00), (9.00 3.00), (7.42 2.47), (3.00 5.00), (3.00 9.00), (5.00 7.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon9)
+    # gives [[(7.00 5.00), (9.00 3.00), (7.42 2.47), (3.00 5.00), (3.00 9.00), (5.00 7.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon9)
 
-# gives [[(3.00 9.00), (5.00 7.00), (7.00 5.00), (9.00 3.00), (6.00 3.50), (3.00 5.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon10)
+    # gives [[(3.00 9.00), (5.00 7.00), (7.00 5.00), (9.00 3.00), (6.00 3.50), (3.00 5.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon10)
 
-# gives [[(9.00 3.00), (3.00 9.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon11)
+    # gives [[(9.00 3.00), (3.00 9.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon11)
 
-# gives [[(9.00 3.00), (7.00 5.00), (6.00 3.50), (6.00 6.00), (7.00 5.00)], [(5.00 7.00), (3.00 9.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon12)
+    # gives [[(9.00 3.00), (7.00 5.00), (6.00 3.50), (6.00 6.00), (7.00 5.00)], [(5.00 7.00), (3.00 9.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon12)
 
-# gives [[(3.00 1.00), (3.00 9.00), (8.27 3.73), (6.00 3.50), (7.57 2.52)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon13)
+    # gives [[(3.00 1.00), (3.00 9.00), (8.27 3.73), (6.00 3.50), (7.57 2.52)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon13)
 
-# gives [[(3.00 1.00), (6.11 5.89), (9.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon14)
+    # gives [[(3.00 1.00), (6.11 5.89), (9.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon14)
 
-# gives [[(3.00 1.00), (3.00 9.00), (9.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon15)
+    # gives [[(3.00 1.00), (3.00 9.00), (9.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon15)
 
-# gives [[(1.92 5.77), (5.00 7.00), (9.00 3.00), (3.00 1.00), (1.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon16)
+    # gives [[(1.92 5.77), (5.00 7.00), (9.00 3.00), (3.00 1.00), (1.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon16)
 
-# gives [[(5.00 7.00), (7.00 5.00), (9.00 3.00), (6.23 2.08), (3.00 3.00), (3.00 5.00), (2.00 6.00), (3.00 9.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon17)
+    # gives [[(5.00 7.00), (7.00 5.00), (9.00 3.00), (6.23 2.08), (3.00 3.00), (3.00 5.00), (2.00 6.00), (3.00 9.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon17)
 
-# gives [[(1.00 3.00), (3.00 9.00), (8.27 3.73), (6.00 3.50), (7.57 2.52), (3.00 1.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon18)
+    # gives [[(1.00 3.00), (3.00 9.00), (8.27 3.73), (6.00 3.50), (7.57 2.52), (3.00 1.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon18)
 
-# gives [[(6.43 2.14), (3.00 3.00), (6.00 3.50), (7.00 5.00), (9.00 3.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon19)
+    # gives [[(6.43 2.14), (3.00 3.00), (6.00 3.50), (7.00 5.00), (9.00 3.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon19)
 
-# gives [[]]
-# has_intersection, intersetion_polygons = calculate_polygon_intersection(
-#     camera, Polygon20)
+    # gives [[]]
+    # has_intersection, intersetion_polygons = calculate_polygon_intersection(
+    #     camera, Polygon20)
 
-# gives [[(7.00 5.00), (6.00 2.00), (3.00 1.00), (2.00 2.00), (6.00 6.00)]]
-# intersetion_polygons = calculate_polygon_intersection(camera, Polygon21)
+    # gives [[(7.00 5.00), (6.00 2.00), (3.00 1.00), (2.00 2.00), (6.00 6.00)]]
+    # intersetion_polygons = calculate_polygon_intersection(camera, Polygon21)
 
-# gives [[]]
-# has_intersection, intersetion_polygons = calculate_polygon_intersection(camera, Polygon22)
+    # gives [[]]
+    # has_intersection, intersetion_polygons = calculate_polygon_intersection(camera, Polygon22)
 
-# gives [[]]
-# has_intersection, intersetion_polygons = calculate_polygon_intersection(
-#     camera, Polygon23)
+    # gives [[]]
+    # has_intersection, intersetion_polygons = calculate_polygon_intersection(
+    #     camera, Polygon23)
 
-# gives [[(9.00 3.00), (6.00 3.50), (7.00 5.00)], [(5.00 7.00), (3.00 5.00), (3.00 9.00)]]
-has_intersection, intersetion_polygons = calculate_polygon_intersection(
-    camera, Polygon24)
+    # gives [[(9.00 3.00), (6.00 3.50), (7.00 5.00)], [(5.00 7.00), (3.00 5.00), (3.00 9.00)]]
+    has_intersection, intersetion_polygons = calculate_polygon_intersection(
+        camera, Polygon24)
 
-print(f"Polygon intersection: {has_intersection}")
-if has_intersection:
-    for polygon in intersetion_polygons:
-        for p in polygon:
-            print(p.to_string())
-        print()
+    print(f"Polygon intersection: {has_intersection}")
+    if has_intersection:
+        for polygon in intersetion_polygons:
+            for p in polygon:
+                print(p.to_string())
+            print()
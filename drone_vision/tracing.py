@@ -0,0 +1,73 @@
+"""
+Leveled tracing of the diagnostics of the clipping and projection pipeline. It's off by default, and the call sites
+check is_enabled before formatting anything, so the hot path pays nothing for it while it's disabled.
+
+To dump the diagnostics of one frame:
+
+    with trace_scope(DEBUG):
+        get_inference_polygons(...)
+
+and to dump them only for some zones of that frame, pass their indexes: trace_scope(DEBUG, zones={3}).
+"""
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set, TextIO
+
+OFF = 0
+INFO = 1  # One line per frame, i.e. the camera footprint.
+DEBUG = 2  # Every step of the clipping of every zone.
+
+level = OFF
+# None writes to the current standard output.
+stream: Optional[TextIO] = None
+# Indexes of the zones to trace, None traces every zone.
+traced_zones: Optional[Set[int]] = None
+# Tells whether the zone being processed is not in 'traced_zones'.
+muted = False
+
+
+def is_enabled(trace_level: int) -> bool:
+    """
+    Determines whether the diagnostics of 'trace_level' are being traced.
+    """
+
+    return level >= trace_level and not muted
+
+
+def trace(trace_level: int, message: str):
+    """
+    Writes 'message' if the diagnostics of 'trace_level' are being traced. The message should only be formatted
+    after checking is_enabled.
+    """
+
+    if is_enabled(trace_level):
+        (stream if stream is not None else sys.stdout).write(message + "\n")
+
+
+def select_zone(zone_index: Optional[int]):
+    """
+    Tells which zone is being processed, muting the tracing if it's not one of the traced zones. None tells that
+    no zone is being processed.
+    """
+
+    global muted
+    muted = zone_index is not None and traced_zones is not None and zone_index not in traced_zones
+
+
+@contextmanager
+def trace_scope(trace_level: int = DEBUG, zones: Optional[Set[int]] = None, output: Optional[TextIO] = None) -> Iterator[None]:
+    """
+    Traces the diagnostics up to 'trace_level' inside the scope, only for 'zones' (every zone if None), writing
+    them to 'output' (the standard output if None). The previous tracing is restored at the end of the scope.
+    """
+
+    global level, stream, traced_zones, muted
+    previous = (level, stream, traced_zones, muted)
+    level = trace_level
+    stream = output
+    traced_zones = zones
+    muted = False
+    try:
+        yield
+    finally:
+        level, stream, traced_zones, muted = previous
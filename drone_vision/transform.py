@@ -0,0 +1,119 @@
+import math
+from math import cos, sin
+from typing import List
+
+from drone_vision.point import point
+from drone_vision.point_array import PointArray
+from drone_vision.quadrilateral import quadrilateral
+
+COMPLETE_CIRCUNFERENCE = 2*math.pi
+ONE_GRADE_IN_RADIANS = math.pi/180
+
+
+class Transform(object):
+    """
+    2D affine transform (x, y) -> (a*x + b*y + c, d*x + e*y + f). Transforms are composed into a single one, so a
+    sequence of rotations, translations and scales is applied to every point at once, with the trigonometry of the
+    rotations calculated once per transform instead of once per point.
+
+    Like point.rotate and point.translate, the z coordinate is omitted and the transform is applied in place.
+    """
+
+    def __init__(self, a: float = 1.0, b: float = 0.0, c: float = 0.0, d: float = 0.0, e: float = 1.0, f: float = 0.0):
+        """
+        Builds the transform with the given coefficients, the identity by default.
+        """
+
+        self.a, self.b, self.c = a, b, c
+        self.d, self.e, self.f = d, e, f
+
+    @classmethod
+    def rotation(cls, beta: float) -> 'Transform':
+        """
+        Rotation by 'beta' radians in counter-clocwise, as point.rotate.
+        """
+
+        cos_beta = cos(beta)
+        sin_beta = sin(beta)
+        return cls(cos_beta, -sin_beta, 0.0, sin_beta, cos_beta, 0.0)
+
+    @classmethod
+    def yaw_rotation(cls, yaw: float) -> 'Transform':
+        """
+        Rotation from the camera coordinate system to the real world one, where the y-axis points to the north,
+        for a 'yaw' in grades measured clockwise, as quadrilateral.rotate.
+        """
+
+        return cls.rotation(COMPLETE_CIRCUNFERENCE - yaw*ONE_GRADE_IN_RADIANS)
+
+    @classmethod
+    def translation(cls, translation_point: point) -> 'Transform':
+        """
+        Translation of the origin by 'translation_point', as point.translate.
+        """
+
+        return cls(1.0, 0.0, translation_point.x, 0.0, 1.0, translation_point.y)
+
+    @classmethod
+    def scale(cls, scale_x: float, scale_y: float = None) -> 'Transform':
+        """
+        Scale by 'scale_x' on x and 'scale_y' on y, by 'scale_x' on both if 'scale_y' is not given.
+        """
+
+        return cls(scale_x, 0.0, 0.0, 0.0, scale_x if scale_y is None else scale_y, 0.0)
+
+    def then(self, other: 'Transform') -> 'Transform':
+        """
+        Returns the transform that applies this transform and then 'other'.
+        """
+
+        return Transform(other.a*self.a + other.b*self.d, other.a*self.b + other.b*self.e, other.a*self.c + other.b*self.f + other.c,
+                         other.d*self.a + other.e*self.d, other.d*self.b + other.e*self.e, other.d*self.c + other.e*self.f + other.f)
+
+    def apply_to_point(self, P: point):
+        """
+        Transforms 'P' in place.
+        """
+
+        x = self.a*P.x + self.b*P.y + self.c
+        P.y = self.d*P.x + self.e*P.y + self.f
+        P.x = x
+
+    def apply_to_polygon(self, polygon: List[point]):
+        """
+        Transforms every point of 'polygon' in place.
+        """
+
+        for P in polygon:
+            self.apply_to_point(P)
+
+    def apply_to_quadrilateral(self, projected_quadrilateral: quadrilateral):
+        """
+        Transforms the four points of 'projected_quadrilateral' in place.
+        """
+
+        self.apply_to_polygon([projected_quadrilateral.A, projected_quadrilateral.B,
+                               projected_quadrilateral.C, projected_quadrilateral.D])
+
+    def apply_to_point_array(self, points: PointArray):
+        """
+        Transforms every point of 'points' in place.
+        """
+
+        x = self.a*points.x + self.b*points.y + self.c
+        points.y = self.d*points.x + self.e*points.y + self.f
+        points.x = x
+
+    def apply(self, target):
+        """
+        Transforms 'target' in place, being a point, a polygon (list of points), a quadrilateral or a PointArray.
+        """
+
+        if isinstance(target, point):
+            self.apply_to_point(target)
+        elif isinstance(target, quadrilateral):
+            self.apply_to_quadrilateral(target)
+        elif isinstance(target, PointArray):
+            self.apply_to_point_array(target)
+        else:
+            self.apply_to_polygon(target)
@@ -1,11 +1,17 @@
-from typing import List, Tuple
+from math import floor
+from typing import Dict, List, Tuple, Union
 
+from drone_vision import tracing
 from drone_vision.quadrilateral import quadrilateral
 from drone_vision.points_operations import vector_norm
-from drone_vision.point import point
+from drone_vision.point import point, EPSILON as POINT_EPSILON
+from drone_vision.point_array import PointArray
 from drone_vision.point_entering import PointEntering
-from drone_vision.polygon_operations import delete_collinear_segments, point_in_polygon, rotate_polygon, point_in_polygon_perimeter, sort_clockwise_polygon, is_polygon_inside_polygon, delete_repeated_points
-from drone_vision.lines_operations import does_segments_intersect, intersection_point_between_lines, does_segments_overlap, point_on_segment
+from drone_vision.polygon_operations import delete_collinear_segments, point_in_polygon, rotate_polygon, point_in_polygon_perimeter, sort_clockwise_polygon, is_polygon_inside_polygon, delete_repeated_points, is_convex_polygon
+from drone_vision.convex_clipping import get_convex_intersection_polygons
+from drone_vision.prepared_zone import PreparedZone
+from drone_vision.zone_index import bounding_boxes_overlap
+from drone_vision.lines_operations import does_segments_intersect, intersection_point_between_lines, does_segments_overlap, point_on_segment, sort_segments_by_x, get_candidate_segments
 
 
 class border_point():
@@ -32,6 +38,18 @@ class border_point():
         return f"idx: {self.index}, is_border: {self.is_border}, is_segment: {self.is_segment}, is_end: {self.is_end}"
 
 
+def trace_border_intersections(title: str, border_intersections: List[List[border_point]]):
+    """
+    Traces every border point of 'border_intersections', one segment per line.
+    """
+
+    tracing.trace(tracing.DEBUG, title + "[")
+    for i in range(0, len(border_intersections)):
+        line = "".join(f"{bp}, " for bp in border_intersections[i])
+        tracing.trace(tracing.DEBUG, f"[{line}]")
+    tracing.trace(tracing.DEBUG, "]")
+
+
 def check_points_in_perimeter(clipped_polygon: List[point], clipping_polygon: List[point]) -> List[bool]:
     """
     Creates a list of size len(clipping_polygon) that stands True if the i-th point in 'clipping_polygon' is
@@ -57,6 +75,7 @@ def get_segment_intersections(clipped_polygon: List[point], clipping_polygon: Li
     """
 
     clipping_polygon_size: int = len(clipping_polygon)
+    clipped_min_xs, clipped_extents = sort_segments_by_x(clipped_polygon)
     border_intersections: List[List[border_point]] = []
     for i in range(0, clipping_polygon_size):
         border_intersections.append([])
@@ -73,13 +92,16 @@ def get_segment_intersections(clipped_polygon: List[point], clipping_polygon: Li
         A: point = clipping_polygon[i]
         B: point = clipping_polygon[next_index]
 
-        for j in range(0, len(clipped_polygon)):
+        # Only the segments whose extents overlap AB are checked, in the same order.
+        for j in get_candidate_segments(A, B, clipped_min_xs, clipped_extents):
             P: point = clipped_polygon[j]
             Q: point = clipped_polygon[(j + 1) % len(clipped_polygon)]
 
             # Verify overlapping in segments
             if(does_segments_overlap(A, B, P, Q)):
-                print(f"Overlap in segments {i} and {j}")
+                if tracing.is_enabled(tracing.DEBUG):
+                    tracing.trace(tracing.DEBUG,
+                                  f"Overlap in segments {i} and {j}")
                 if point_on_segment(A, P, Q):
                     border_intersections[i].append(
                         border_point(A, True, j, True))
@@ -141,13 +163,9 @@ def get_segment_intersections(clipped_polygon: List[point], clipping_polygon: Li
                     border_intersections[i].append(
                         border_point(intersection, False, j))
 
-    print("Border points as intersections:", end="[\n")
-    for i in range(0, len(border_intersections)):
-        print("[", end="")
-        for bp in border_intersections[i]:
-            print(bp, end=", ")
-        print("]")
-    print("]")
+    if tracing.is_enabled(tracing.DEBUG):
+        trace_border_intersections(
+            "Border points as intersections:", border_intersections)
 
     return border_intersections
 
@@ -161,13 +179,9 @@ def polish_clipping_polygon_intersections(clipping_polygon: List[point], border_
         A = clipping_polygon[i]
         border_intersections[i].sort(key=lambda p: vector_norm(p.P, origin=A))
 
-    print("Sorted border points as intersections:", end="[\n")
-    for i in range(0, len(border_intersections)):
-        print("[", end="")
-        for bp in border_intersections[i]:
-            print(bp, end=", ")
-        print("]")
-    print("]")
+    if tracing.is_enabled(tracing.DEBUG):
+        trace_border_intersections(
+            "Sorted border points as intersections:", border_intersections)
 
 
 def build_clipping_and_clipped_polygon_lists(clipped_polygon: List[point], clipping_polygon: List[point]) -> Tuple[List[PointEntering], List[PointEntering]]:
@@ -264,23 +278,85 @@ def build_clipping_and_clipped_polygon_lists(clipped_polygon: List[point], clipp
         for p in clipped_polygon_intersections[i]:
             clipped_polygon_list.append(p)
 
-    for p in clipped_polygon_list:
-        p.print()
-    print("End of clipped polygon list")
-    for p in clipping_polygon_list:
-        p.print()
-    print("End of clipping polygon list")
+    if tracing.is_enabled(tracing.DEBUG):
+        for p in clipped_polygon_list:
+            tracing.trace(tracing.DEBUG, p.to_string())
+        tracing.trace(tracing.DEBUG, "End of clipped polygon list")
+        for p in clipping_polygon_list:
+            tracing.trace(tracing.DEBUG, p.to_string())
+        tracing.trace(tracing.DEBUG, "End of clipping polygon list")
+
+    link_polygon_lists(clipped_polygon_list, clipping_polygon_list)
 
     return clipped_polygon_list, clipping_polygon_list
 
 
-def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: List[point]) -> List[List[point]]:
+def get_point_entering_cell(pe: PointEntering) -> Tuple[int, int]:
+    """
+    Returns the cell of side POINT_EPSILON that contains 'pe'. Equal points lie on the same or on contiguous cells.
+    """
+
+    return floor(pe.P.x/POINT_EPSILON), floor(pe.P.y/POINT_EPSILON)
+
+
+def find_first_equal_indexes(polygon_list: List[PointEntering], other_polygon_list: List[PointEntering]) -> List[int]:
+    """
+    For every PointEntering in 'polygon_list' returns the index of the first PointEntering of 'other_polygon_list'
+    that is equal to it, or None if there is not any. The points of 'other_polygon_list' are hashed by cell, so every
+    search only looks at the points of the contiguous cells.
+    """
+
+    cells: Dict[Tuple[int, int, bool], List[int]] = {}
+    for k in range(0, len(other_polygon_list)):
+        x, y = get_point_entering_cell(other_polygon_list[k])
+        cells.setdefault(
+            (x, y, other_polygon_list[k].entering), []).append(k)
+
+    first_equal_indexes: List[int] = []
+    for pe in polygon_list:
+        x, y = get_point_entering_cell(pe)
+        first_equal_index = None
+        for i in range(x - 1, x + 2):
+            for j in range(y - 1, y + 2):
+                for k in cells.get((i, j, pe.entering), ()):
+                    if first_equal_index is not None and k >= first_equal_index:
+                        break
+                    if other_polygon_list[k].equal(pe):
+                        first_equal_index = k
+                        break
+        first_equal_indexes.append(first_equal_index)
+
+    return first_equal_indexes
+
+
+def link_polygon_lists(clipped_polygon_list: List[PointEntering], clipping_polygon_list: List[PointEntering]):
+    """
+    Links every PointEntering with the index of its equal one in the other polygon list, so the traversal of the
+    Weiler-Atherton algorithm switches between lists in constant time.
+    """
+
+    clipped_indexes = find_first_equal_indexes(
+        clipping_polygon_list, clipped_polygon_list)
+    for i in range(0, len(clipping_polygon_list)):
+        clipping_polygon_list[i].clipped_index = clipped_indexes[i]
+
+    clipping_indexes = find_first_equal_indexes(
+        clipped_polygon_list, clipping_polygon_list)
+    for i in range(0, len(clipped_polygon_list)):
+        clipped_polygon_list[i].clipping_index = clipping_indexes[i]
+
+
+def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: List[point], is_prepared: bool = False) -> List[List[point]]:
     """
     Returns every (if any) intersection polygon in 'clipped_polygon' and 'clipping_polygon'. 'clipped_polygon' should
     always be a convex polygon, i.e. the camera_vision.
+
+    'is_prepared' tells that 'clipping_polygon' is already sorted clockwise and without collinear segments, i.e. it
+    comes from a PreparedZone.
     """
 
-    clipping_polygon = sort_clockwise_polygon(clipping_polygon)
+    if not is_prepared:
+        clipping_polygon = sort_clockwise_polygon(clipping_polygon)
 
     clipping_in_clipped: bool = is_polygon_inside_polygon(
         clipping_polygon, clipped_polygon)
@@ -288,7 +364,8 @@ def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: Li
     if(clipping_in_clipped):
         return [clipping_polygon]
 
-    clipping_polygon = delete_collinear_segments(clipping_polygon)
+    if not is_prepared:
+        clipping_polygon = delete_collinear_segments(clipping_polygon)
 
     # We will rotate clipping_polygon till the first point is not inside the polygon.
     # We could actually do this 'cause, as a previous step, we did verify that the polygon its not contained.
@@ -296,10 +373,11 @@ def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: Li
     while(point_in_polygon(clipping_polygon[0], clipped_polygon)):
         clipping_polygon = rotate_polygon(clipping_polygon)
 
-    print("Polygon cleaned:")
-    for p in clipping_polygon:
-        print(p.to_string())
-    print("End of cleaned polygon")
+    if tracing.is_enabled(tracing.DEBUG):
+        tracing.trace(tracing.DEBUG, "Polygon cleaned:")
+        for p in clipping_polygon:
+            tracing.trace(tracing.DEBUG, p.to_string())
+        tracing.trace(tracing.DEBUG, "End of cleaned polygon")
 
     intersection_polygons: List[List[point]] = []
 
@@ -342,29 +420,28 @@ def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: Li
                 if(not found_exit):
                     continue
 
-                for k in range(0, len(clipped_polygon_list)):
-                    if(clipped_polygon_list[k].equal(clipping_polygon_list[j])):
-                        intersection_polygon.append(clipped_polygon_list[k].P)
-                        j = (k + 1) % len(clipped_polygon_list)
-                        turn = 1 - turn
-                        found_exit = False
-                        # print(f"Start on clipped_polygon_list in index {j - 1}")
-                        break
+                k = clipping_polygon_list[j].clipped_index
+                if k is None:
+                    # There is no way to continue the intersection polygon.
+                    break
+                intersection_polygon.append(clipped_polygon_list[k].P)
+                j = (k + 1) % len(clipped_polygon_list)
+                turn = 1 - turn
+                found_exit = False
+                # print(f"Start on clipped_polygon_list in index {j - 1}")
             else:
                 if(P_ini.equal(clipped_polygon_list[j])):
                     break
 
                 intersection_polygon.append(clipped_polygon_list[j].P)
                 if(clipped_polygon_list[j].intersection and clipped_polygon_list[j].entering):
-                    for k in range(0, len(clipping_polygon_list)):
-                        if(clipped_polygon_list[j].equal(clipping_polygon_list[k])):
-                            if seen_points[k]:
-                                not_exit = False  # Its a loop of points.
-                                break
-                            seen_points[k] = True
-                            turn = 1 - turn
-                            j = (k + 1) % len(clipping_polygon_list)
-                            break
+                    k = clipped_polygon_list[j].clipping_index
+                    if k is None or seen_points[k]:
+                        not_exit = False  # Its a loop of points.
+                    else:
+                        seen_points[k] = True
+                        turn = 1 - turn
+                        j = (k + 1) % len(clipping_polygon_list)
                 else:
                     j = (j + 1) % len(clipped_polygon_list)
 
@@ -377,18 +454,37 @@ def get_intersection_polygons(clipped_polygon: List[point], clipping_polygon: Li
     return delete_repeated_points(intersection_polygons)
 
 
-def calculate_polygon_intersection(camera_projection: quadrilateral, polygon: List[point]) -> Tuple[bool, List[List[point]]]:
+def calculate_polygon_intersection(camera_projection: quadrilateral, polygon: Union[List[point], PointArray, PreparedZone]) -> Tuple[bool, List[List[point]]]:
     """
-    Calculate and return the intersection (if any) between 'camera_projection' and 'polygon'.
+    Calculate and return the intersection (if any) between 'camera_projection' and 'polygon'. When the camera
+    projection is convex (the usual case) the linear time convex clipping is used instead of Weiler-Atherton.
+
+    'polygon' can be a PointArray (like a PolygonArray). It can be a PreparedZone too, in that case it's only
+    translated to be seen from the drone position of 'camera_projection' and it's discarded without clipping
+    when the bounding boxes don't overlap.
 
     Returns:
     has_intersection: boolean, polygons_intersections: List[List[point]]
     """
 
+    is_prepared = isinstance(polygon, PreparedZone)
+    if is_prepared:
+        offset = polygon.get_offset(camera_projection.drone_position)
+        if not bounding_boxes_overlap(camera_projection.get_bounding_box(), polygon.get_plane_bounding_box(offset)):
+            return False, None
+        polygon = polygon.to_plane(offset)
+    elif isinstance(polygon, PointArray):
+        # The clippers walk and slice the polygon point by point.
+        polygon = polygon.to_points()
+
     camera_projection_formatted = camera_projection.to_weilmar_atherton_representation()
 
-    polygon_intersections: List[List[point]] = get_intersection_polygons(
-        camera_projection_formatted, polygon)
+    if is_convex_polygon(camera_projection_formatted):
+        polygon_intersections: List[List[point]] = get_convex_intersection_polygons(
+            camera_projection_formatted, polygon, is_prepared)
+    else:
+        polygon_intersections: List[List[point]] = get_intersection_polygons(
+            camera_projection_formatted, polygon, is_prepared)
 
     if len(polygon_intersections) == 0:
         return False, None
@@ -0,0 +1,106 @@
+from itertools import count
+from math import floor
+from typing import Dict, List, Tuple
+
+# Side of every cell of the grid in degrees, about 110 meters in latitude.
+DEFAULT_CELL_SIZE = 0.001
+# Latitude and longitude are given as (θ, φ) degrees.
+BoundingBox = Tuple[float, float, float, float]
+# Identifiers of the indexes, never reused, unlike the id of an object.
+IDENTIFIERS = count()
+
+
+def get_bounding_box(polygon: List[List[float]]) -> BoundingBox:
+    """
+    Returns the bounding box (min_theta, min_phi, max_theta, max_phi) of 'polygon' given as [[θ1, φ1], ..., [θn, φn]].
+    """
+
+    thetas = [p[0] for p in polygon]
+    phis = [p[1] for p in polygon]
+    return min(thetas), min(phis), max(thetas), max(phis)
+
+
+def bounding_boxes_overlap(A: BoundingBox, B: BoundingBox) -> bool:
+    """
+    Determines whether bounding boxes 'A' and 'B' overlap.
+    """
+
+    return A[0] <= B[2] and B[0] <= A[2] and A[1] <= B[3] and B[1] <= A[3]
+
+
+class ZoneIndex(object):
+    """
+    Uniform grid in (latitude, longitude) over a set of restriction zones. Every zone is registered in the cells that
+    its bounding box covers, so the zones near some area are found by looking only at the cells that the area covers.
+    The index is built once and queried on every frame with the camera footprint bounding box.
+    """
+
+    def __init__(self, polygons: List[List[List[float]]], cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Builds the index over 'polygons', where every polygon is given as [[θ1, φ1], ..., [θn, φn]] or as a PreparedZone.
+        """
+
+        self.cell_size = cell_size
+        self.polygons: List[List[List[float]]] = []
+        self.bounding_boxes: List[BoundingBox] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        # Incremented on every change of the zones, so the results calculated with them can be invalidated.
+        self.version = 0
+        self.identifier = next(IDENTIFIERS)
+
+        for polygon in polygons:
+            self.insert(polygon)
+
+    def __len__(self) -> int:
+        return len(self.polygons)
+
+    def get_cell_range(self, bounding_box: BoundingBox) -> Tuple[int, int, int, int]:
+        """
+        Returns the range of cells (min_row, min_column, max_row, max_column) covered by 'bounding_box'.
+        """
+
+        return (floor(bounding_box[0]/self.cell_size), floor(bounding_box[1]/self.cell_size),
+                floor(bounding_box[2]/self.cell_size), floor(bounding_box[3]/self.cell_size))
+
+    def insert(self, polygon: List[List[float]]) -> int:
+        """
+        Adds 'polygon' to the index and returns its index. 'polygon' can be a PreparedZone too, in that case
+        its bounding box is reused.
+        """
+
+        index = len(self.polygons)
+        bounding_box = polygon.bounding_box if hasattr(
+            polygon, "bounding_box") else get_bounding_box(polygon)
+        self.polygons.append(polygon)
+        self.bounding_boxes.append(bounding_box)
+        self.version += 1
+
+        min_row, min_column, max_row, max_column = self.get_cell_range(
+            bounding_box)
+        for row in range(min_row, max_row + 1):
+            for column in range(min_column, max_column + 1):
+                self.cells.setdefault((row, column), []).append(index)
+
+        return index
+
+    def query(self, bounding_box: BoundingBox) -> List[int]:
+        """
+        Returns, in insertion order, the indexes of the zones whose bounding box overlaps 'bounding_box'.
+        """
+
+        candidates = set()
+        min_row, min_column, max_row, max_column = self.get_cell_range(
+            bounding_box)
+        for row in range(min_row, max_row + 1):
+            for column in range(min_column, max_column + 1):
+                candidates.update(self.cells.get((row, column), ()))
+
+        return [index for index in sorted(candidates)
+                if bounding_boxes_overlap(self.bounding_boxes[index], bounding_box)]
+
+    def query_polygons(self, bounding_box: BoundingBox) -> List[List[List[float]]]:
+        """
+        Returns, in insertion order, the zones whose bounding box overlaps 'bounding_box'.
+        """
+
+        return [self.polygons[index] for index in self.query(bounding_box)]
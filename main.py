@@ -1,28 +1,27 @@
 from typing import List
 import matplotlib.pyplot as plt
 from drone_vision.point import point
-from drone_vision.camera_projections import get_quadrilateral_projection, get_horizontal_and_vertical_FOV
+from drone_vision.camera_model import CameraModel
+from drone_vision.camera_projections import get_quadrilateral_projection
 from drone_vision.polygon_operations import format_simple_polygon
+from drone_vision.transform import Transform
 from drone_vision.weiler_atherton_algorithm import calculate_polygon_intersection
 
+# FOV = 84, sensor diagonal, horizontal and vertical sizes given in mm.
+CAMERA_MODEL = CameraModel.from_sensor(84, 8, 6.4, 4.8)
+
 
 def draw_intersection(x: float, y: float, z: float, inclination_theta: float, yaw: float, coord_polygon: List[List[float]]) -> None:
     """
     Given the position of the drone as x,y,z; its inclination angle for the camera, the yaw and a zone of interest ('coord_polygon'),
     calculates the intersection between the camera footprint of the drone and the simple polygon given.
     """
-    FOV = 84
-    sensor_diagonal = 8  # This is given in mm.
-    sensor_horizontal = 6.4  # mm
-    sensor_vertical = 4.8  # mm
-    HFOV, VFOV = get_horizontal_and_vertical_FOV(
-        FOV, sensor_diagonal, sensor_horizontal, sensor_vertical)
     drone_position = point(x, y, z)
 
     camera_footprint = get_quadrilateral_projection(
-        inclination_theta, HFOV, VFOV, z, drone_position)
-    camera_footprint.translate(point(x, y, 0))
-    camera_footprint.rotate(yaw)
+        inclination_theta, CAMERA_MODEL.horizontal_FOV, CAMERA_MODEL.vertical_FOV, z, drone_position, CAMERA_MODEL)
+    Transform.translation(point(x, y, 0)).then(
+        Transform.yaw_rotation(yaw)).apply(camera_footprint)
 
     camera_footprint_coords = []
     camera_footprint_points = camera_footprint.to_weilmar_atherton_representation()